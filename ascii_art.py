@@ -1,28 +1,58 @@
 import os
 import logging
-from typing import List
-from PIL import Image, ImageFont, ImageDraw, UnidentifiedImageError
-from skimage.metrics import structural_similarity as ssim
+from typing import Callable, List
+from PIL import Image, UnidentifiedImageError
 import numpy as np
 from chromosome import Chromosome
+from functools import partial
+from fitness import compute_score_table, table_fitness, best_genome, block_scores, image_to_blocks, pixel_scores_at, table_scores_at
+from ssim_fitness import SSIMEvaluator, combined_fitness
+from penalties import is_separable, with_penalties
+from glyph_atlas import load_glyph_atlas, load_font, draw_character, default_font_size
+from initialization import initial_genomes, load_genome_file
+from pyramid import coarse_to_fine_genome
+from checkpoint import CheckpointWriter, checkpoint_key, load_checkpoint
+from instrumentation import MetricsRecorder, ProfilerObserver
+from convergence import ConvergenceController
+from local_search import LocalSearch
+from reporting import ProgressReporter, save_results, VERBOSITY_PREVIEW
+from population_engine import PopulationEngine, run_genetic_algorithm
+from parallel_evaluation import ParallelEvaluator
+from island_model import run_island_model
+from tiled_ga import run_tiled_ga
 import random
-import matplotlib.pyplot as plt
 
 # Configurare logging
 logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 
-def preprocess_image(image_path: str, block_size: tuple[int, int]) -> Image.Image | None:
+def preprocess_image(image_path: str,
+                     block_size: tuple[int, int],
+                     max_size: tuple[int, int] | None = None) -> Image.Image | None:
     """
     Procesăm imaginea pentru a putea fi convertită in ASCII art.
     Funcția încarcă imaginea, se asigură că este în format grayscale, iar la nevoie o trunchiază și o redimensionează.
+    Dacă este dat max_size (lățime, înălțime), imaginile mai mari sunt micșorate cât să încapă în el; pentru JPEG
+    decodarea se face direct la o rezoluție redusă și în grayscale (draft mode), ceea ce e mult mai rapid.
     """
     try:
         with Image.open(image_path) as image:
+            fits = max_size is None or (image.width <= max_size[0] and image.height <= max_size[1])
+            if not fits:
+                scale = min(max_size[0] / image.width, max_size[1] / image.height)
+                # Pentru JPEG decodorul reduce direct imaginea (1/2, 1/4 sau 1/8) si produce grayscale
+                image.draft('L', (int(image.width * scale), int(image.height * scale)))
+                image.load()
+
             # Convertirea imamginii la grayscale
             if image.mode != 'L':
                 logging.info("Se converteste imaginea la grayscale...")
                 image = image.convert('L')
 
+            if not fits and (image.width > max_size[0] or image.height > max_size[1]):
+                logging.info(f"Micsoram imaginea de la {image.size} pentru a incapea in {max_size}.")
+                image = image.copy()
+                image.thumbnail(max_size, Image.LANCZOS)
+
             # Trunchierea imaginea, astfel incat latimea sa fie un multiplu de block_size[0], iar inaltimea sa fie un multiplu de block_size[1]
             width, height = image.size
             new_width = (width // block_size[0]) * block_size[0]
@@ -46,6 +76,13 @@ def preprocess_image(image_path: str, block_size: tuple[int, int]) -> Image.Imag
         logging.error(f"A aparut o eroare la procesarea imaginii: {e}")
         return None
 
+def parse_characters(line: str) -> List[str]:
+    """
+    Caracterele dintr-o linie a fișierului de caractere, fără spațiile de la capete și fără duplicate.
+    """
+    return list(dict.fromkeys(line.strip()))
+
+
 def get_ascii_characters(source: str = os.path.join("input", "characters.txt")) -> List[str]:
     """
     Obține caracterele ASCII dintr-un fișier text.
@@ -55,7 +92,7 @@ def get_ascii_characters(source: str = os.path.join("input", "characters.txt"))
         with open(source, 'r', encoding='utf-8') as file:
             # Citim doar prima linie din fișier și extragem caracterele
             # Eliminam duplicatele
-            characters = list(dict.fromkeys(file.readline().strip()))
+            characters = parse_characters(file.readline())
             if not characters:
                 logging.warning(
                     "Fisierul de caractere este gol sau nu contine caractere valide.")
@@ -74,34 +111,9 @@ def get_ascii_characters(source: str = os.path.join("input", "characters.txt"))
 def render_character(character: str, block_size: tuple[int, int], font: str = "arial.ttf") -> Image.Image:
     """
     Randează un caracter ASCII într-o imagine de dimensiuni specificate.
+    Pentru un set întreg de caractere folosiți load_glyph_atlas, care încarcă fontul o singură dată.
     """
-    width, height = block_size
-    # Creăm o imagine goală cu fundal negru
-    image = Image.new('L', (width, height), color=0)
-
-    try:
-        # Încercăm să încărcăm fontul specificat
-        font = ImageFont.truetype(font, size=min(width, height)*1.40)
-    except IOError:
-        logging.warning(
-            f"Fontul '{font}' nu a putut fi gasit. Se va folosi fontul implicit.")
-        font = ImageFont.load_default()
-
-    draw = ImageDraw.Draw(image)
-
-    # Obținem “bounding box” al caracterului la poziția 0,0
-    # textbbox returnează tuple (left, top, right, bottom)
-    bbox = draw.textbbox((0, 0), character, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-
-    # Calculăm coordonatele pentru centrare
-    x = (width - text_width) // 2 - bbox[0]
-    y = (height - text_height) // 2 - bbox[1]
-
-    draw.text((x, y), character, fill=255, font=font)
-
-    return image
+    return draw_character(character, block_size, load_font(font, default_font_size(block_size)))
 
 def image_zone_to_character_similarity(image: Image.Image, character_image: Image.Image) -> float:
     """
@@ -136,43 +148,34 @@ def finess_function(image: Image.Image,
     Evaluează similitudinea dintre imaginea originală și imaginea ASCII generată.
     """
     fitness = 0.0
-    width, height = image.size
-    block_width, block_height = block_size
     ascii_width, ascii_height = ascii_art_size
 
+    # Imaginea este împărțită o singură dată în blocuri (un view, fără copierea pixelilor)
+    blocks = image_to_blocks(np.array(image, dtype=np.uint8), block_size, ascii_art_size)
+    character_arrays = {character: np.array(character_image) for character, character_image in ascii_characters_images.items()}
+    normalization = block_size[0] * block_size[1] * 255.0
+
     for y in range(ascii_height):
         for x in range(ascii_width):
             # Obținem caracterul ASCII corespunzător
             character = ascii_image[y][x]
-            if character not in ascii_characters_images:
+            if character not in character_arrays:
                 logging.warning(f"Caracterul '{character}' nu are o imagine asociata.")
                 continue
 
-            character_image = ascii_characters_images[character]
-
-            # Calculăm coordonatele zonei din imaginea originală
-            left = x * block_width
-            top = y * block_height
-            right = left + block_width
-            bottom = top + block_height
-
-            # Extragem zona din imaginea originală
-            image_zone = image.crop((left, top, right, bottom))
-
-            # Calculăm similaritatea dintre zona din imagine și imaginea caracterului
-            similarity = image_zone_to_character_similarity(image_zone, character_image)
-            
-            fitness += similarity
+            # Calculăm similaritatea L1 dintre blocul din imagine și imaginea caracterului
+            fitness += np.sum(character_arrays[character] - blocks[y, x]) / normalization
 
     return (fitness / (ascii_width * ascii_height)) if ascii_width * ascii_height > 0 else 0.0
 
-def generate_population(size : int) -> List[Chromosome]:
+def generate_population(size : int, genomes: np.ndarray | None = None) -> List[Chromosome]:
     """
     Generează o populație de cromozomi pentru algoritmul genetic.
+    Dacă sunt dați genomii inițiali (vezi initialization.py), cromozomii pornesc din ei.
     """
     population = []
-    for _ in range(size):
-        chromosome = Chromosome()
+    for index in range(size):
+        chromosome = Chromosome() if genomes is None else Chromosome(genome=genomes[index])
         population.append(chromosome)
     
     return population
@@ -182,15 +185,49 @@ def evaluate_individuals(population: List[Chromosome],
                         ascii_characters_images: dict[str, Image.Image],
                         block_size: tuple[int, int],
                         ascii_art_size: tuple[int, int] = (0, 0),
-                        maximum_similarity = 1
+                        maximum_similarity = 1,
+                        score_table: np.ndarray | None = None,
+                        evaluate_genomes: Callable[[np.ndarray], np.ndarray] | None = None
                         ) -> List[Chromosome]:
     """
     Evaluează populația de cromozomi și le setează fitness-ul.
+    Dacă este dat tabelul de scoruri precalculat, toată populația este evaluată printr-o singură indexare.
+    Dacă este dată o funcție de evaluare pe genomi (de ex. ParallelEvaluator), toată populația îi este trimisă deodată.
     """
+    if evaluate_genomes is None and score_table is not None:
+        evaluate_genomes = lambda genomes: table_fitness(score_table, genomes)
+
+    if evaluate_genomes is not None:
+        genomes = np.stack([chromosome.genome for chromosome in population])
+        for chromosome, fitness in zip(population, evaluate_genomes(genomes)):
+            chromosome.set_fitness(float(fitness))
+        return
+
     for chromosome in population:
         fitness = finess_function(image, chromosome.ascii_image,ascii_characters_images, block_size, ascii_art_size, maximum_similarity)
         chromosome.set_fitness(fitness)
 
+def evaluate_individuals_incremental(population: List[Chromosome],
+                                    score_blocks: Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+                                    ) -> None:
+    """
+    Evaluează populația recalculând doar blocurile modificate prin crossover și mutație.
+    score_blocks(rows, columns, glyph_indices) întoarce scorurile blocurilor cerute.
+    Fitness-ul rămâne exact, fiind media contribuțiilor tuturor blocurilor.
+    """
+    for chromosome in population:
+        if chromosome.block_scores is None:
+            # Cromozom nou: calculăm toate blocurile o singură dată
+            rows, columns = np.indices(chromosome.genome.shape)
+            chromosome.block_scores = score_blocks(rows.ravel(), columns.ravel(), chromosome.genome.ravel()).reshape(chromosome.genome.shape)
+            chromosome.changed = np.zeros(chromosome.genome.shape, dtype=bool)
+        else:
+            rows, columns = np.nonzero(chromosome.changed)
+            chromosome.block_scores[rows, columns] = score_blocks(rows, columns, chromosome.genome[rows, columns])
+            chromosome.changed[rows, columns] = False
+
+        chromosome.set_fitness(float(chromosome.block_scores.mean()))
+
 def evaluate_population(population: List[Chromosome]) -> float:
     """
     Calculeaza meadia fitness-ului.
@@ -220,20 +257,17 @@ def select_parents(population: List[Chromosome],
 def crossover(parent1: Chromosome, parent2: Chromosome) -> Chromosome:
     """
     Efectuează crossover între doi părinți pentru a crea un nou cromozom.
-    Functia utilizeaza crossover uniform.
-    """
-    new_ascii_image = []
-    for y in range(Chromosome.height):
-        new_row = []
-        for x in range(Chromosome.width):
-            # Alege aleatoriu un caracter de la unul dintre părinți
-            if random.random() < 0.5:
-                new_row.append(parent1.ascii_image[y][x])
-            else:
-                new_row.append(parent2.ascii_image[y][x])
-        new_ascii_image.append(new_row)
+    Functia utilizeaza crossover uniform, printr-o masca aleatoare peste toata matricea.
+    """
+    # Alege aleatoriu pentru fiecare genă unul dintre părinți
+    mask = Chromosome.rng.random(parent1.genome.shape) < 0.5
+
+    # Contribuțiile blocurilor se moștenesc odată cu genele, pentru evaluarea incrementală
+    block_scores = None
+    if parent1.block_scores is not None and parent2.block_scores is not None:
+        block_scores = np.where(mask, parent1.block_scores, parent2.block_scores)
 
-    return Chromosome(new_ascii_image)    
+    return Chromosome(genome=np.where(mask, parent1.genome, parent2.genome), block_scores=block_scores)
 
 def mutate_population(population: List[Chromosome], mutation_rate: float) -> None:
     """
@@ -265,41 +299,17 @@ def generate_next_generation(parents: List[Chromosome],
 def generate_ascii_art(image: Image.Image, 
                         ascii_characters_images: dict[str, Image.Image], 
                         block_size: tuple[int, int], 
-                        ascii_art_size: tuple[int, int]) :
+                        ascii_art_size: tuple[int, int],
+                        score_table: np.ndarray | None = None) :
     """
     Generează ASCII art din imaginea dată selectand cel mai potrivit caracter pentru fiecare bloc.
+    Cel mai potrivit caracter este argmax-ul din tabelul de scoruri (calculat aici dacă nu este dat).
     """
-    ascii_art = []
-    width, height = image.size
-    block_width, block_height = block_size
-    ascii_width, ascii_height = ascii_art_size
-
-    for y in range(ascii_height):
-        row = []
-        for x in range(ascii_width):
-            # Calculăm coordonatele zonei din imaginea originală
-            left = x * block_width
-            top = y * block_height
-            right = left + block_width
-            bottom = top + block_height
-
-            # Extragem zona din imaginea originală
-            image_zone = image.crop((left, top, right, bottom))
-
-            # Găsim cel mai potrivit caracter pentru această zonă
-            best_character = None
-            best_similarity = -1.0
+    if score_table is None:
+        score_table = compute_score_table(image, ascii_characters_images, block_size, ascii_art_size)
 
-            for character, char_image in ascii_characters_images.items():
-                similarity = image_zone_to_character_similarity(image_zone, char_image)
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_character = character
-
-            row.append(best_character)
-
-        ascii_art.append(''.join(row))
-    return ascii_art
+    ascii_characters = list(ascii_characters_images.keys())
+    return [''.join(ascii_characters[index] for index in row) for row in best_genome(score_table)]
 
 def introduce_new_chromosomes(population: List[Chromosome],
                             population_size: int,
@@ -315,10 +325,215 @@ def introduce_new_chromosomes(population: List[Chromosome],
 
     return population
 
+class ObjectPopulationEngine:
+    """
+    Motorul clasic de populație: indivizii sunt obiecte Chromosome prelucrate unul câte unul.
+    Expune aceleași operații ca PopulationEngine, pentru a putea fi folosit în aceeași buclă.
+    """
+
+    def __init__(self,
+                 evaluate: Callable[[List[Chromosome]], None],
+                 population_size: int,
+                 tournament_size: int = 5,
+                 elitism: int = 3,
+                 population: List[Chromosome] | None = None) -> None:
+        self.evaluate_individuals = evaluate
+        self.population_size = population_size
+        self.alphabet_size = len(Chromosome.ascii_character_list)
+        self.tournament_size = tournament_size
+        self.elitism = elitism
+        self.population = population if population is not None else generate_population(population_size)
+        self.parents = self.population
+
+    def population_genomes(self) -> np.ndarray:
+        """
+        Genomii populației curente, ca array (P, H, W).
+        """
+        return np.stack([chromosome.genome for chromosome in self.population])
+
+    def get_state(self) -> dict:
+        """
+        Copia stării populației (genomi, fitness, părinți, generatoare aleatoare), pentru checkpoint.
+        """
+        state = {"genomes": np.stack([chromosome.genome for chromosome in self.population]),
+                 "fitness": np.array([chromosome.fitness for chromosome in self.population]),
+                 "parents": np.stack([chromosome.genome for chromosome in self.parents]),
+                 "parent_fitness": np.array([chromosome.fitness for chromosome in self.parents]),
+                 "rng_state": Chromosome.rng.bit_generator.state,
+                 "random_state": random.getstate(),
+                 "population_size": self.population_size}
+        if all(chromosome.block_scores is not None for chromosome in self.population + self.parents):
+            state["block_scores"] = np.stack([chromosome.block_scores for chromosome in self.population])
+            state["changed"] = np.stack([chromosome.changed for chromosome in self.population])
+            state["parent_block_scores"] = np.stack([chromosome.block_scores for chromosome in self.parents])
+        return state
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restaurează starea salvată cu get_state.
+        """
+        def restore(genomes, fitness, block_scores=None, changed=None) -> List[Chromosome]:
+            chromosomes = []
+            for index in range(len(genomes)):
+                chromosome = Chromosome(genome=genomes[index],
+                                        block_scores=None if block_scores is None else block_scores[index].copy())
+                if changed is not None:
+                    chromosome.changed = changed[index].copy()
+                chromosome.set_fitness(float(fitness[index]))
+                chromosomes.append(chromosome)
+            return chromosomes
+
+        self.population = restore(state["genomes"], state["fitness"], state.get("block_scores"), state.get("changed"))
+        self.parents = restore(state["parents"], state["parent_fitness"], state.get("parent_block_scores"))
+        Chromosome.rng.bit_generator.state = state["rng_state"]
+        version, internal_state, gauss_next = state["random_state"]
+        random.setstate((version, tuple(internal_state), gauss_next))
+        self.population_size = int(state.get("population_size", self.population_size))
+
+    def resize(self, population_size: int) -> None:
+        """
+        Schimbă numărul de indivizi generați începând cu generația următoare.
+        """
+        self.population_size = population_size
+
+    def evaluate(self) -> None:
+        """
+        Evaluează populația curentă.
+        """
+        self.evaluate_individuals(self.population)
+
+    def local_search(self, local_search: LocalSearch) -> int:
+        """
+        Rafinează prin hill-climbing o parte din populația evaluată și actualizează fitness-ul ei.
+        Întoarce numărul de evaluări echivalente consumate.
+        """
+        count = local_search.count(len(self.population))
+        if local_search.selection == "elite":
+            selected = sorted(self.population, key=lambda c: c.fitness, reverse=True)[:count]
+        else:
+            selected = random.sample(self.population, count)
+
+        genomes, scores, evaluations = local_search.refine(np.stack([chromosome.genome for chromosome in selected]),
+                                                           self.alphabet_size)
+        for chromosome, genome, chromosome_scores in zip(selected, genomes, scores):
+            chromosome.genome = genome
+            chromosome.set_fitness(float(chromosome_scores.mean()))
+            if chromosome.block_scores is not None:
+                chromosome.block_scores = chromosome_scores
+        return evaluations
+
+    def average_fitness(self) -> float:
+        """
+        Media fitness-ului populației curente.
+        """
+        return evaluate_population(self.population)
+
+    def best_chromosome(self) -> Chromosome:
+        """
+        Cel mai bun cromozom din populația curentă.
+        """
+        return max(self.population, key=lambda c: c.fitness)
+
+    def select_parents(self) -> None:
+        """
+        Selectează părinții prin turneu și elitism.
+        """
+        self.parents = select_parents(self.population, self.population_size, self.tournament_size, self.elitism)
+
+    def generate_next_generation(self) -> None:
+        """
+        Generează următoarea generație prin crossover.
+        """
+        self.population = generate_next_generation(self.parents, self.population_size)
+
+    def mutate(self, mutation_rate: float) -> None:
+        """
+        Efectuează mutații asupra populației.
+        """
+        mutate_population(self.population, mutation_rate)
+
+    def introduce_new_chromosomes(self, new_chromosomes_percentage: float) -> None:
+        """
+        Introduce cromozomi noi în populație.
+        """
+        self.population = introduce_new_chromosomes(self.population, self.population_size, new_chromosomes_percentage)
+
 if __name__ == "__main__":
     font = "DejaVuSansMono.ttf"  # Fontul folosit pentru a desena caracterele
     image_name = "pickachu_fundal_colorat.jpg"
     block_size = (8, 16)
+    max_image_size = None  # de ex. (2000, 2000): imaginile mai mari sunt micsorate (rapid, la decodare, pentru JPEG)
+    engine_type = "tensor"  # "object" (lista de Chromosome) sau "tensor" (populatia ca un singur array)
+    # Functia de fitness: "l1" (pe blocuri), "ssim" (structurala, pe toata imaginea) sau "l1+ssim"
+    fitness_mode = "l1"
+    ssim_weight = 0.5  # Ponderea SSIM in modul "l1+ssim"
+    # Penalizari (0 = dezactivate): schimbari abrupte de luminozitate intre vecini si caractere repetate pe rand
+    coherence_weight = 0.0
+    repetition_weight = 0.0
+    # "auto" = solutia exacta (argmax pe fiecare bloc) cand fitness-ul este separabil, altfel algoritmul genetic;
+    # "exact" sau "ga" forteaza una dintre variante
+    solver = "auto"
+    # Evaluarea L1: "table" = din tabelul de scoruri, "parallel" = tabelul de scoruri pe mai multe procese
+    # (castiga doar pentru populatii si grile mari, altfel comunicarea costa mai mult decat evaluarea),
+    # "incremental" = doar blocurile modificate prin crossover/mutatie, direct din pixeli
+    evaluation_mode = "table"
+    worker_count = None  # Numarul de procese pentru evaluarea paralela (None = toate procesoarele)
+
+    # Modelul cu insule: island_count sub-populatii in procese separate (0 = o singura populatie)
+    island_count = 0
+    island_population_size = 50
+    migration_interval = 20
+    migration_size = 5
+    migration_topology = "ring"  # "ring" sau "all"
+
+    # Modul pe tile-uri pentru imagini mari: fiecare tile (latime, inaltime in blocuri) are populatia lui
+    tile_size = None  # de ex. (40, 20); None = toata grila ca un singur genom
+    tile_worker_count = None  # Numarul de procese pentru tile-uri (None = toate procesoarele, 1 = secvential)
+
+    # Initializarea populatiei: "random", "greedy" (din solutia greedy), "luminance" (caractere potrivite
+    # dupa luminozitate), "file" (dintr-un rezultat anterior, initial_ascii_art_path) sau "pyramid" (din rezultatul
+    # marit al unor rulari scurte pe grile micsorate de pyramid_factors ori)
+    initialization_strategy = "random"
+    seeded_fraction = 0.25  # Fractiunea din populatie pornita din solutia aleasa
+    seed_perturbation_rate = 0.05  # Rata de mutatie aplicata copiilor solutiei de pornire
+    initial_ascii_art_path = os.path.join("output", "best_ascii_art.txt")
+    pyramid_factors = (4, 2)
+    pyramid_generation_count = 100
+
+    # Checkpoint-uri periodice ale starii complete (0 = dezactivate) si reluarea unei rulari intrerupte
+    checkpoint_interval = 0
+    checkpoint_path = os.path.join("output", "checkpoint.npz")
+    resume = False
+
+    # Instrumentare: masuratorile fiecarei generatii (.jsonl sau .csv) si profilarea unor generatii
+    metrics_path = None  # de ex. os.path.join("output", "metrics.jsonl")
+    profile_generations = None  # de ex. (10, 20): generatiile profilate cu cProfile
+    profile_path = os.path.join("output", "profile.prof")
+
+    # Afisarea progresului: VERBOSITY_QUIET, VERBOSITY_PROGRESS (o linie) sau VERBOSITY_PREVIEW (si imaginea ASCII),
+    # cel mult o data la preview_every_generations generatii si preview_every_seconds secunde
+    verbosity = VERBOSITY_PREVIEW
+    preview_every_generations = 10
+    preview_every_seconds = 1.0
+    # Fara fereastra pentru grafic (doar fisierele din output); None = detectat automat
+    headless = None
+
+    # Oprirea mai devreme (None = dezactivat): tinta ca fractiune din fitness-ul solutiei greedy (doar pentru "l1"),
+    # generatii fara imbunatatirea celui mai bun fitness, timp maxim si numar maxim de evaluari
+    target_fitness_fraction = None  # de ex. 0.95
+    stagnation_generations = None  # de ex. 50
+    time_budget_seconds = None
+    evaluation_budget = None
+    # Dimensiunea adaptiva a populatiei, intre aceste limite (None = fixa)
+    min_population_size = None  # de ex. 50
+    max_population_size = None  # de ex. 400
+
+    # Cautarea locala (memetica): dupa fiecare evaluare, fractiunea aleasa din populatie ("elite" = cei mai buni,
+    # "random" = alesi aleatoriu) este rafinata prin hill-climbing pe blocuri; 0 = dezactivata, doar pentru "l1"
+    # fara penalizari (cu solver = "ga", altfel se foloseste direct solutia exacta)
+    local_search_fraction = 0.0  # de ex. 0.05
+    local_search_selection = "elite"
+    local_search_steps = 3
 
     # Parametri pentru populatie
     population_size = 200
@@ -333,11 +548,8 @@ if __name__ == "__main__":
     introduce_new_chromosomes_interval = 25
     new_chromosomes_percentage = 0.25
 
-    average_fitness_history = []
-    best_fitness_history = []
-
     image_path = os.path.join("input", "images", image_name)
-    image = preprocess_image(image_path, block_size)
+    image = preprocess_image(image_path, block_size, max_image_size)
     
     if image is None:
         logging.error("Imaginea nu a putut fi procesată. Asigurați-vă că calea este corectă și imaginea este validă.")
@@ -347,68 +559,213 @@ if __name__ == "__main__":
     ascii_characters = get_ascii_characters()
 
     if ascii_characters:
-            # Cream un dictionar carater imagine
-        ascii_characters_images = {char: render_character(char, block_size, font) for char in ascii_characters}
+        # Incarcam atlasul caracterelor (randat o singura data si pastrat in cache pe disc)
+        glyph_atlas = load_glyph_atlas(ascii_characters, block_size, font)
+        # Cream un dictionar carater imagine
+        ascii_characters_images = glyph_atlas.images()
+
+        # Precalculam scorul fiecarei perechi (bloc, caracter) o singura data pentru toata rularea
+        score_table = compute_score_table(image, ascii_characters_images, block_size, ascii_art_size)
 
         # Generam cel mai bun ASCII art conform functiei de fitness
-        best_ascii_art = generate_ascii_art(image, ascii_characters_images, block_size, ascii_art_size)
-        for line in best_ascii_art:
-            print(line)
+        best_ascii_art = generate_ascii_art(image, ascii_characters_images, block_size, ascii_art_size, score_table)
+        if verbosity >= VERBOSITY_PREVIEW:
+            print("\n".join(best_ascii_art))
         # evaluam imaginea ASCII generată
-        maximum_fitness = finess_function(image, best_ascii_art, ascii_characters_images, block_size, ascii_art_size)
+        maximum_fitness = table_fitness(score_table, best_genome(score_table))
         logging.info(f"Fitness-ul imaginii ASCII generate: {maximum_fitness:.4f}")
 
         # Setăm parametrii pentru cromozomi
         Chromosome.set_ascii_character_list(ascii_characters)
         Chromosome.set_size(ascii_art_size)
 
-        # Generăm populația
-        population = generate_population(population_size)
-        # Evaluăm populația
-        evaluate_individuals(population, image, ascii_characters_images, block_size, ascii_art_size)
-        average_fitness_history.append(evaluate_population(population))
-        # Selectăm părinți
-        parents = select_parents(population, population_size, tournament_size, elitism)
-
-        # Generăm următoarea generație
-        for generation in range(generation_count):
-            print(f"Generatia {generation + 1}/{generation_count}")
-            next_generation = generate_next_generation(parents, population_size)
-            # Efectuăm mutații
-            mutate_population(next_generation, mutation_rate)
-            evaluate_individuals(next_generation, image, ascii_characters_images, block_size, ascii_art_size)
-            average_fitness = evaluate_population(next_generation)
-            average_fitness_history.append(average_fitness)
-            print(f"Fitness-ul mediu al generatiei: {average_fitness:.4f}")
-            print(f"Rata de mutatie curenta: {mutation_rate}")
-            # Pregătim pentru următoarea iterație
-            population = next_generation
-            parents = select_parents(population, population_size, tournament_size, elitism)
-
-            # Afisam imaginea ASCII generată de cel mai bun cromozom pentru fiecare generatie
-            best_chromosome = max(population, key=lambda c: c.fitness)
-            best_fitness_history.append(best_chromosome.fitness)
-            print("Imaginea ASCII generata de cel mai bun cromozom:")
-            best_chromosome.print()
-
-            if generation > past_generation_count and abs(average_fitness_history[-1] - average_fitness_history[-past_generation_count]) <= epsilon:
-                mutation_rate = min(mutation_rate + 0.02, max_mutation_rate)
+        # Fitness-ul structural (SSIM) se calculeaza pe toata imaginea randata, in loturi
+        ssim_evaluator = None
+        if fitness_mode != "l1":
+            ssim_evaluator = SSIMEvaluator(np.array(image), glyph_atlas.bitmaps, ascii_art_size)
+        current_ssim_weight = 1.0 if fitness_mode == "ssim" else ssim_weight
+
+        if solver not in ("auto", "exact", "ga"):
+            raise ValueError(f"Solver necunoscut: {solver}")
+        separable = is_separable(fitness_mode, coherence_weight, repetition_weight)
+        if solver == "exact" and not separable:
+            logging.warning("Solutia exacta este optima doar pentru fitness-ul L1 fara penalizari.")
+
+        # Setarile folosite doar de bucla algoritmului genetic, ignorate de solutia exacta si de modelul cu insule
+        ga_settings = [
+            ("engine_type", engine_type != "tensor"), ("evaluation_mode", evaluation_mode != "table"),
+            ("initialization_strategy", initialization_strategy != "random"),
+            ("local_search_fraction", local_search_fraction > 0),
+            ("checkpoint_interval", checkpoint_interval > 0), ("resume", resume),
+            ("metrics_path", metrics_path is not None), ("profile_generations", profile_generations is not None),
+            ("target_fitness_fraction", target_fitness_fraction is not None),
+            ("stagnation_generations", stagnation_generations is not None),
+            ("time_budget_seconds", time_budget_seconds is not None),
+            ("evaluation_budget", evaluation_budget is not None),
+            ("min_population_size", min_population_size is not None),
+            ("max_population_size", max_population_size is not None)]
+
+        if solver == "exact" or (solver == "auto" and separable):
+            # Fitness-ul este o suma de termeni independenti pe blocuri: optimul global este argmax-ul pe fiecare bloc
+            logging.info("Fitness separabil: se foloseste solutia exacta, fara algoritmul genetic.")
+            ignored_settings = [name for name, ignored in [("island_count", island_count > 0),
+                                                           ("tile_size", tile_size is not None)] + ga_settings
+                                if ignored]
+            if ignored_settings:
+                logging.warning(f"Solutia exacta ignora: {', '.join(ignored_settings)} "
+                                f"(solver = \"ga\" pentru algoritmul genetic).")
+            best_chromosome = Chromosome(genome=best_genome(score_table))
+            best_chromosome.set_fitness(maximum_fitness)
+            average_fitness_history = []
+            best_fitness_history = [maximum_fitness]
+        elif island_count > 0:
+            if not separable:
+                raise ValueError("Modelul cu insule suporta doar fitness-ul L1 fara penalizari "
+                                 "(fitness_mode = \"l1\", coherence_weight = repetition_weight = 0).")
+            # Insulele au propriul motor (tensor, evaluat din tabelul de scoruri) si pornesc din populatii aleatoare
+            ignored_settings = [name for name, ignored in [("tile_size", tile_size is not None)] + ga_settings
+                                if ignored]
+            if ignored_settings:
+                logging.warning(f"Modelul cu insule ignora: {', '.join(ignored_settings)}.")
+            # Fiecare insula evolueaza in procesul ei, evaluand din tabelul de scoruri
+            best_island_genome, best_island_fitness, average_fitness_histories, best_fitness_histories = run_island_model(
+                score_table, island_count, island_population_size, generation_count, tournament_size, elitism,
+                mutation_rate, base_mutation_rate, max_mutation_rate, epsilon, past_generation_count,
+                migration_interval, migration_size, migration_topology)
+            best_chromosome = Chromosome(genome=best_island_genome)
+            best_chromosome.set_fitness(best_island_fitness)
+            average_fitness_history = np.mean(average_fitness_histories, axis=0)
+            best_fitness_history = np.max(best_fitness_histories, axis=0)
+            for index, island_best_history in enumerate(best_fitness_histories):
+                logging.info(f"Insula {index}: cel mai bun fitness {island_best_history[-1]:.4f}")
+            if verbosity >= VERBOSITY_PREVIEW:
+                print("Imaginea ASCII generata de cel mai bun cromozom:")
+                best_chromosome.print()
+        elif tile_size is not None:
+            if coherence_weight or repetition_weight:
+                logging.warning("Tile-urile nu folosesc penalizarile pentru vecini si repetitii.")
+            # Tile-urile evolueaza pe L1; cu SSIM activ, granitele dintre ele sunt rafinate pe metrica combinata
+            seam_fitness = None
+            if ssim_evaluator is not None:
+                seam_fitness = lambda genomes, region: combined_fitness(
+                    block_scores(score_table[region[1]:region[3], region[0]:region[2]], genomes).mean(axis=(1, 2)),
+                    ssim_evaluator.evaluate_region(genomes, region), current_ssim_weight)
+            tiled_genome, tiled_fitness, best_fitness_history = run_tiled_ga(
+                score_table, tile_size, population_size, generation_count, tournament_size, elitism,
+                mutation_rate, base_mutation_rate, max_mutation_rate, epsilon, past_generation_count,
+                introduce_new_chromosomes_interval, new_chromosomes_percentage, tile_worker_count,
+                seam_fitness=seam_fitness)
+            best_chromosome = Chromosome(genome=tiled_genome)
+            best_chromosome.set_fitness(tiled_fitness)
+            average_fitness_history = []
+            if verbosity >= VERBOSITY_PREVIEW:
+                print("Imaginea ASCII generata pe tile-uri:")
+                best_chromosome.print()
+        else:
+            # Alegem modul de evaluare
+            parallel_evaluator = None
+            evaluate_genomes = None
+            score_blocks = None
+            if fitness_mode == "ssim":
+                evaluate_genomes = ssim_evaluator
+            elif fitness_mode == "l1+ssim":
+                evaluate_genomes = lambda genomes: combined_fitness(table_fitness(score_table, genomes),
+                                                                    ssim_evaluator(genomes), ssim_weight)
+            elif evaluation_mode == "parallel":
+                parallel_evaluator = ParallelEvaluator(score_table, worker_count)
+                evaluate_genomes = parallel_evaluator
+            elif evaluation_mode == "incremental":
+                score_blocks = partial(pixel_scores_at,
+                                       image_to_blocks(np.array(image), block_size, ascii_art_size),
+                                       glyph_atlas.bitmaps)
+            else:
+                evaluate_genomes = lambda genomes: table_fitness(score_table, genomes)
+
+            if coherence_weight or repetition_weight:
+                if score_blocks is not None:
+                    # Penalizarile depind de vecini, deci nu se pot actualiza doar pe blocurile modificate
+                    logging.warning("Evaluarea incrementala nu suporta penalizarile; se foloseste tabelul de scoruri.")
+                    score_blocks = None
+                    evaluate_genomes = lambda genomes: table_fitness(score_table, genomes)
+                evaluate_genomes = with_penalties(evaluate_genomes, glyph_atlas.luminance, coherence_weight,
+                                                  repetition_weight)
+
+            # Populatia initiala
+            prior_genome = None
+            if initialization_strategy == "file":
+                prior_genome = load_genome_file(initial_ascii_art_path, ascii_characters, ascii_art_size)
+            elif initialization_strategy == "pyramid":
+                prior_genome = coarse_to_fine_genome(
+                    image, ascii_characters_images, block_size, ascii_art_size, pyramid_factors, population_size,
+                    pyramid_generation_count, tournament_size, elitism, mutation_rate, base_mutation_rate,
+                    max_mutation_rate, epsilon, past_generation_count, introduce_new_chromosomes_interval,
+                    new_chromosomes_percentage, seed_perturbation_rate, Chromosome.rng)
+            genomes = initial_genomes(initialization_strategy, population_size, len(ascii_characters), ascii_art_size,
+                                      Chromosome.rng, seeded_fraction, seed_perturbation_rate, score_table=score_table,
+                                      blocks=image_to_blocks(np.array(image), block_size, ascii_art_size),
+                                      luminance=glyph_atlas.luminance, prior_genome=prior_genome)
+
+            # Alegem motorul de populatie
+            if engine_type == "tensor":
+                engine = PopulationEngine(evaluate_genomes, population_size, len(ascii_characters), ascii_art_size,
+                                          tournament_size, elitism, genomes=genomes, score_blocks=score_blocks)
+            elif score_blocks is not None:
+                engine = ObjectPopulationEngine(
+                    lambda population: evaluate_individuals_incremental(population, score_blocks),
+                    population_size, tournament_size, elitism, generate_population(population_size, genomes))
             else:
-                mutation_rate = max(mutation_rate - 0.005, base_mutation_rate)
-                
-            if(generation % introduce_new_chromosomes_interval == 0):
-                population = introduce_new_chromosomes(population, population_size, new_chromosomes_percentage)
+                engine = ObjectPopulationEngine(
+                    lambda population: evaluate_individuals(population, image, ascii_characters_images, block_size,
+                                                            ascii_art_size, evaluate_genomes=evaluate_genomes),
+                    population_size, tournament_size, elitism, generate_population(population_size, genomes))
+
+            # Identitatea rularii: un checkpoint salvat pentru alta imagine sau alti parametri este refuzat la reluare
+            run_key = checkpoint_key(score_table, ascii_characters, block_size, engine_type=engine_type,
+                                     fitness_mode=fitness_mode, ssim_weight=ssim_weight,
+                                     coherence_weight=coherence_weight, repetition_weight=repetition_weight,
+                                     tournament_size=tournament_size, elitism=elitism)
+            resume_state = None
+            if resume and os.path.exists(checkpoint_path):
+                resume_state = load_checkpoint(checkpoint_path, run_key)
+            checkpoint_writer = CheckpointWriter(checkpoint_path, run_key) if checkpoint_interval > 0 else None
+
+            target_fitness = None
+            if target_fitness_fraction is not None:
+                if fitness_mode == "l1":
+                    target_fitness = target_fitness_fraction * maximum_fitness
+                else:
+                    logging.warning("Tinta de fitness se aplica doar fitness-ului L1.")
+            controller = ConvergenceController(target_fitness, stagnation_generations, time_budget_seconds,
+                                               evaluation_budget, min_population_size=min_population_size,
+                                               max_population_size=max_population_size)
+
+            local_search = None
+            if local_search_fraction > 0:
+                if separable:
+                    local_search = LocalSearch(partial(table_scores_at, score_table), local_search_fraction,
+                                               local_search_selection, steps=local_search_steps)
+                else:
+                    logging.warning("Cautarea locala foloseste doar fitness-ul L1 fara penalizari si este dezactivata.")
+
+            observers = []
+            if metrics_path is not None:
+                observers.append(MetricsRecorder(metrics_path))
+            if profile_generations is not None:
+                observers.append(ProfilerObserver(profile_generations[0], profile_generations[1], profile_path))
+
+            try:
+                average_fitness_history, best_fitness_history, best_chromosome = run_genetic_algorithm(
+                    engine, generation_count, mutation_rate, base_mutation_rate, max_mutation_rate, epsilon,
+                    past_generation_count, introduce_new_chromosomes_interval, new_chromosomes_percentage,
+                    checkpoint_writer=checkpoint_writer, checkpoint_interval=checkpoint_interval,
+                    resume_state=resume_state, observers=observers,
+                    reporter=ProgressReporter(verbosity, preview_every_generations, preview_every_seconds),
+                    controller=controller, local_search=local_search)
+            finally:
+                if checkpoint_writer is not None:
+                    checkpoint_writer.close()
+                if parallel_evaluator is not None:
+                    parallel_evaluator.close()
+
         # Salvam imaginea ascii generata de cel mai bun cromozom intr-un fisier text din output si plotam evolutia fitness-ului pe care o salvam tot in fisier
-        best_chromosome = max(population, key=lambda c: c.fitness)
-        with open(os.path.join("output", "best_ascii_art.txt"), "w") as f:
-            for line in best_chromosome.ascii_image:
-                f.write("".join(line) + "\n")
-        
-        plt.plot(average_fitness_history, label="Fitness mediu")
-        plt.plot(best_fitness_history, label="Fitness cel mai bun")
-        plt.xlabel("Generatia")
-        plt.ylabel("Fitness")
-        plt.title("Evolutia fitness-ului")
-        plt.legend()
-        plt.savefig(os.path.join("output", "fitness_evolution.png"))
-        plt.show()
\ No newline at end of file
+        save_results(best_chromosome.to_text(), average_fitness_history, best_fitness_history, "output", headless)
@@ -0,0 +1,211 @@
+import argparse
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+from ascii_art import preprocess_image, get_ascii_characters
+from fitness import compute_score_table, table_fitness, best_genome
+from glyph_atlas import load_glyph_atlas
+from initialization import perturbed_copies
+from population_engine import PopulationEngine, run_genetic_algorithm
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tif", ".tiff", ".webp")
+
+# Atlasul caracterelor, încărcat o singură dată în fiecare proces worker
+_worker_atlas = None
+
+
+def list_images(directory: str) -> List[str]:
+    """
+    Imaginile dintr-un director, în ordinea numelui (ordinea cadrelor pentru o secvență video).
+    """
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory))
+            if name.lower().endswith(IMAGE_EXTENSIONS)]
+
+
+def _initialize_worker(ascii_characters: List[str], block_size: Tuple[int, int], font: str) -> None:
+    """
+    Încarcă atlasul în worker; atlasul este citit din cache-ul de pe disc prin memory-mapping,
+    deci toate procesele folosesc aceleași pagini de memorie.
+    """
+    global _worker_atlas
+    _worker_atlas = load_glyph_atlas(ascii_characters, block_size, font)
+
+
+def convert_image(image_path: str,
+                  atlas,
+                  block_size: Tuple[int, int],
+                  population_size: int = 200,
+                  generation_count: int = 400,
+                  tournament_size: int = 7,
+                  elitism: int = 5,
+                  mutation_rate: float = 0.1,
+                  base_mutation_rate: float = 0.06,
+                  max_mutation_rate: float = 0.2,
+                  epsilon: float = 0.0001,
+                  past_generation_count: int = 10,
+                  introduce_new_chromosomes_interval: int = 25,
+                  new_chromosomes_percentage: float = 0.25,
+                  initial_genome: Optional[np.ndarray] = None,
+                  seed: Optional[int] = None,
+                  max_image_size: Optional[Tuple[int, int]] = None,
+                  solver: str = "auto") -> Optional[Tuple[np.ndarray, float]]:
+    """
+    Convertește o singură imagine: preprocesare, tabel de scoruri și algoritm genetic.
+    Fitness-ul L1 este separabil, deci cu solver "auto" sau "exact" rezultatul este direct argmax-ul pe
+    fiecare bloc (vezi fitness.best_genome), fără algoritmul genetic; "ga" forțează algoritmul genetic.
+    Dacă este dat initial_genome (de ex. rezultatul cadrului anterior), populația pornește din el.
+    Imaginile mai mari decât max_image_size sunt micșorate încă de la decodare.
+    Întoarce cel mai bun genom și fitness-ul lui, sau None dacă imaginea nu a putut fi procesată.
+    """
+    image = preprocess_image(image_path, block_size, max_image_size)
+    if image is None:
+        return None
+    ascii_art_size = (image.size[0] // block_size[0], image.size[1] // block_size[1])
+
+    score_table = compute_score_table(image, atlas.images(), block_size, ascii_art_size)
+    if solver in ("auto", "exact"):
+        genome = best_genome(score_table)
+        return genome, float(table_fitness(score_table, genome))
+    if solver != "ga":
+        raise ValueError(f"Solver necunoscut: {solver}")
+    rng = np.random.default_rng(seed)
+
+    genomes = None
+    if initial_genome is not None and initial_genome.shape == (ascii_art_size[1], ascii_art_size[0]):
+        # Pornire "la cald": copii mutate ale genomului dat, plus genomul neschimbat
+        genomes = perturbed_copies(initial_genome, population_size, base_mutation_rate, len(atlas.characters), rng)
+
+    engine = PopulationEngine(lambda candidates: table_fitness(score_table, candidates),
+                              population_size, len(atlas.characters), ascii_art_size,
+                              tournament_size, elitism, rng=rng, genomes=genomes)
+    run_genetic_algorithm(engine, generation_count, mutation_rate, base_mutation_rate, max_mutation_rate,
+                          epsilon, past_generation_count, introduce_new_chromosomes_interval,
+                          new_chromosomes_percentage, verbose=False)
+
+    best_index = int(engine.fitness.argmax())
+    return engine.genomes[best_index].copy(), float(engine.fitness[best_index])
+
+
+def _convert_in_worker(image_path: str, block_size: Tuple[int, int], parameters: dict) -> Optional[Tuple[np.ndarray, float]]:
+    """
+    Rulează convert_image într-un worker, cu atlasul încărcat la inițializare.
+    """
+    return convert_image(image_path, _worker_atlas, block_size, **parameters)
+
+
+def convert_images(image_paths: Iterable[str],
+                   ascii_characters: List[str],
+                   block_size: Tuple[int, int],
+                   font: str,
+                   worker_count: Optional[int] = None,
+                   **parameters) -> Iterator[Tuple[str, Optional[Tuple[np.ndarray, float]]]]:
+    """
+    Convertește imaginile independent, în paralel, și întoarce rezultatele pe măsură ce sunt gata,
+    ca (cale, rezultat). Numărul de imagini în lucru este limitat (de două ori numărul de workeri),
+    astfel încât memoria rămâne mărginită indiferent de câte imagini sunt.
+    """
+    # Randăm atlasul o singură dată, înainte de pornirea workerilor, ca ei să-l găsească în cache
+    load_glyph_atlas(ascii_characters, block_size, font)
+    worker_count = worker_count or os.cpu_count() or 1
+    image_paths = iter(image_paths)
+
+    with ProcessPoolExecutor(max_workers=worker_count, initializer=_initialize_worker,
+                             initargs=(ascii_characters, block_size, font)) as executor:
+        pending = {}
+        while True:
+            for image_path in image_paths:
+                pending[executor.submit(_convert_in_worker, image_path, block_size, parameters)] = image_path
+                if len(pending) >= 2 * worker_count:
+                    break
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+
+
+def convert_frames(frame_paths: Iterable[str],
+                   ascii_characters: List[str],
+                   block_size: Tuple[int, int],
+                   font: str,
+                   warm_generation_count: Optional[int] = None,
+                   worker_count: Optional[int] = None,
+                   **parameters) -> Iterator[Tuple[str, Optional[Tuple[np.ndarray, float]]]]:
+    """
+    Convertește o secvență de cadre. Cu algoritmul genetic (solver "ga") cadrele sunt convertite în ordine,
+    într-un singur proces: populația fiecărui cadru pornește din cel mai bun genom al cadrului anterior,
+    deci sunt necesare mai puține generații (warm_generation_count). Soluția exactă nu depinde de cadrul
+    anterior, așa că în acest caz cadrele sunt convertite independent, în paralel, cu convert_images.
+    """
+    if parameters.get("solver", "auto") != "ga":
+        yield from convert_images(frame_paths, ascii_characters, block_size, font, worker_count, **parameters)
+        return
+    if worker_count is not None and worker_count > 1:
+        logging.warning("Cadrele pornite la cald sunt convertite in ordine, intr-un singur proces; "
+                        "numarul de workeri este ignorat.")
+
+    atlas = load_glyph_atlas(ascii_characters, block_size, font)
+    previous_genome = None
+
+    for frame_path in frame_paths:
+        frame_parameters = dict(parameters)
+        if previous_genome is not None and warm_generation_count is not None:
+            frame_parameters["generation_count"] = warm_generation_count
+
+        result = convert_image(frame_path, atlas, block_size, initial_genome=previous_genome, **frame_parameters)
+        if result is not None:
+            previous_genome = result[0]
+        yield frame_path, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Converteste toate imaginile (sau cadrele) dintr-un director in ASCII art.")
+    parser.add_argument("input_directory", help="Directorul cu imagini sau cu cadrele unui video")
+    parser.add_argument("--output-directory", default=os.path.join("output", "batch"))
+    parser.add_argument("--characters", default=os.path.join("input", "characters.txt"))
+    parser.add_argument("--font", default="DejaVuSansMono.ttf")
+    parser.add_argument("--block-size", type=int, nargs=2, default=(8, 16), metavar=("LATIME", "INALTIME"))
+    parser.add_argument("--population-size", type=int, default=200)
+    parser.add_argument("--generations", type=int, default=400)
+    parser.add_argument("--solver", choices=("auto", "exact", "ga"), default="auto",
+                        help="auto/exact = solutia exacta (argmax pe fiecare bloc), ga = algoritmul genetic")
+    parser.add_argument("--max-image-size", type=int, nargs=2, default=None, metavar=("LATIME", "INALTIME"),
+                        help="Imaginile mai mari sunt micsorate sa incapa in aceasta dimensiune")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Numarul de procese (implicit toate procesoarele); ignorat pentru --video cu --solver ga")
+    parser.add_argument("--video", action="store_true",
+                        help="Trateaza imaginile ca o secventa de cadre, cu pornire la cald (doar cu --solver ga, intr-un singur proces)")
+    parser.add_argument("--warm-generations", type=int, default=None, help="Generatii pentru cadrele pornite la cald")
+    arguments = parser.parse_args()
+
+    ascii_characters = get_ascii_characters(arguments.characters)
+    if not ascii_characters:
+        raise SystemExit(1)
+
+    block_size = tuple(arguments.block_size)
+    image_paths = list_images(arguments.input_directory)
+    os.makedirs(arguments.output_directory, exist_ok=True)
+
+    if arguments.video:
+        results = convert_frames(image_paths, ascii_characters, block_size, arguments.font,
+                                 warm_generation_count=arguments.warm_generations, worker_count=arguments.workers,
+                                 population_size=arguments.population_size, generation_count=arguments.generations,
+                                 max_image_size=arguments.max_image_size, solver=arguments.solver)
+    else:
+        results = convert_images(image_paths, ascii_characters, block_size, arguments.font, arguments.workers,
+                                 population_size=arguments.population_size, generation_count=arguments.generations,
+                                 max_image_size=arguments.max_image_size, solver=arguments.solver)
+
+    # Rezultatele sunt scrise pe disc imediat ce sunt gata
+    for image_path, result in results:
+        if result is None:
+            logging.error(f"Imaginea '{image_path}' nu a putut fi convertita.")
+            continue
+        genome, fitness = result
+        output_path = os.path.join(arguments.output_directory, os.path.splitext(os.path.basename(image_path))[0] + ".txt")
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write("\n".join("".join(ascii_characters[index] for index in row) for row in genome) + "\n")
+        logging.info(f"{image_path} -> {output_path} (fitness {fitness:.4f})")
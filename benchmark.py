@@ -0,0 +1,179 @@
+import argparse
+import contextlib
+import datetime
+import io
+import itertools
+import json
+import logging
+import os
+import random
+import subprocess
+import time
+import tracemalloc
+from typing import Callable, List, Optional
+import numpy as np
+from ascii_art import (preprocess_image, parse_characters, finess_function, crossover, select_parents, generate_population,
+                       evaluate_individuals, ObjectPopulationEngine)
+from chromosome import Chromosome
+from fitness import compute_score_table, table_fitness
+from glyph_atlas import load_glyph_atlas
+from population_engine import PopulationEngine, run_genetic_algorithm
+
+
+def read_charsets(source: str = os.path.join("input", "characters.txt")) -> List[List[str]]:
+    """
+    Toate variantele de seturi de caractere din fișier (câte una pe fiecare linie nevidă).
+    """
+    with open(source, "r", encoding="utf-8") as file:
+        return [parse_characters(line) for line in file if line.strip()]
+
+
+def git_commit() -> Optional[str]:
+    """
+    Commit-ul curent, pentru a putea compara rezultatele între versiuni.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(function: Callable[[], None], repeat: int) -> tuple[float, int]:
+    """
+    Timpul mediu al unui apel (fără tracemalloc, care încetinește codul) și memoria maximă alocată
+    în timpul unui apel separat, măsurată cu tracemalloc.
+    """
+    function()  # Încălzire
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    seconds = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    function()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak_memory
+
+
+def benchmark_configuration(image_path: str,
+                            block_size: tuple[int, int],
+                            ascii_characters: List[str],
+                            population_size: int,
+                            generation_count: int,
+                            repeat: int,
+                            font: str) -> List[dict]:
+    """
+    Măsoară fiecare etapă (fitness, crossover, mutație, selecție) și o rulare completă pentru o configurație.
+    """
+    image = preprocess_image(image_path, block_size)
+    ascii_art_size = (image.size[0] // block_size[0], image.size[1] // block_size[1])
+    ascii_characters_images = load_glyph_atlas(ascii_characters, block_size, font).images()
+
+    Chromosome.set_ascii_character_list(ascii_characters)
+    Chromosome.set_size(ascii_art_size)
+    Chromosome.set_seed(0)
+    random.seed(0)
+
+    score_table = compute_score_table(image, ascii_characters_images, block_size, ascii_art_size)
+    population = generate_population(population_size)
+    evaluate_individuals(population, image, ascii_characters_images, block_size, ascii_art_size, score_table=score_table)
+    genomes = np.stack([chromosome.genome for chromosome in population])
+    # Mutația se măsoară pe o copie, ca etapele următoare să vadă populația neschimbată
+    mutated_chromosome = Chromosome(genome=population[0].genome)
+
+    def run_generations(engine) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_genetic_algorithm(engine, generation_count, 0.1, 0.06, 0.2, 0.0001, 10, 25, 0.25, verbose=False)
+
+    stages = [
+        # (etapa, funcție, evaluări per apel, generații per apel, apeluri de măsurat)
+        ("finess_function", lambda: finess_function(image, population[0].ascii_image, ascii_characters_images,
+                                                     block_size, ascii_art_size), 1, 0, 1),
+        ("compute_score_table", lambda: compute_score_table(image, ascii_characters_images, block_size,
+                                                            ascii_art_size), 0, 0, 1),
+        ("table_fitness", lambda: table_fitness(score_table, genomes), population_size, 0, repeat),
+        ("crossover", lambda: crossover(population[0], population[1]), 0, 0, repeat),
+        ("mutate", lambda: mutated_chromosome.mutate(0.1), 0, 0, repeat),
+        ("select_parents", lambda: select_parents(population, population_size, 7, 5), 0, 0, repeat),
+        ("generation_object", lambda: run_generations(ObjectPopulationEngine(
+            lambda candidates: evaluate_individuals(candidates, image, ascii_characters_images, block_size,
+                                                    ascii_art_size, score_table=score_table),
+            population_size, 7, 5)), population_size * (generation_count + 1), generation_count, 1),
+        ("generation_tensor", lambda: run_generations(PopulationEngine(
+            lambda candidates: table_fitness(score_table, candidates), population_size, len(ascii_characters),
+            ascii_art_size, 7, 5, rng=np.random.default_rng(0))), population_size * (generation_count + 1),
+         generation_count, 1),
+    ]
+
+    results = []
+    for stage, function, evaluations, generations, calls in stages:
+        seconds, peak_memory = measure(function, calls)
+        results.append({
+            "stage": stage,
+            "image": os.path.basename(image_path),
+            "ascii_art_size": list(ascii_art_size),
+            "block_size": list(block_size),
+            "charset_size": len(ascii_characters),
+            "population_size": population_size,
+            "seconds_per_call": seconds,
+            "calls_per_second": 1.0 / seconds if seconds > 0 else None,
+            "evaluations_per_second": evaluations / seconds if evaluations and seconds > 0 else None,
+            "generations_per_second": generations / seconds if generations and seconds > 0 else None,
+            "peak_memory_bytes": peak_memory,
+        })
+        logging.info(f"{stage:>20} {os.path.basename(image_path)} bloc={block_size} caractere={len(ascii_characters)} "
+                     f"populatie={population_size}: {seconds * 1000:.3f} ms/apel, memorie {peak_memory / 2**20:.1f} MiB")
+    return results
+
+
+def compare(results: List[dict], baseline: List[dict]) -> None:
+    """
+    Afișează raportul dintre timpii curenți și cei dintr-o rulare anterioară, pentru configurațiile comune.
+    """
+    def key(result: dict) -> tuple:
+        return (result["stage"], result["image"], tuple(result["block_size"]), result["charset_size"], result["population_size"])
+
+    baseline_by_key = {key(result): result for result in baseline}
+    for result in results:
+        previous = baseline_by_key.get(key(result))
+        if previous is not None and result["seconds_per_call"] > 0:
+            speedup = previous["seconds_per_call"] / result["seconds_per_call"]
+            print(f"{result['stage']:>20} {result['image']} bloc={tuple(result['block_size'])} "
+                  f"caractere={result['charset_size']} populatie={result['population_size']}: x{speedup:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Masoara costul etapelor algoritmului genetic si al unei rulari complete.")
+    parser.add_argument("--images", nargs="*", default=None, help="Imaginile folosite (implicit cele din input/images)")
+    parser.add_argument("--block-sizes", nargs="*", default=["8x16", "4x8"], help="Dimensiuni de bloc, de forma LxI")
+    parser.add_argument("--population-sizes", type=int, nargs="*", default=[50, 200])
+    parser.add_argument("--generations", type=int, default=10, help="Generatii pentru masurarea buclei complete")
+    parser.add_argument("--repeat", type=int, default=20, help="Repetari pentru etapele rapide")
+    parser.add_argument("--font", default="DejaVuSansMono.ttf")
+    parser.add_argument("--output", default=os.path.join("output", "benchmark.json"))
+    parser.add_argument("--compare", default=None, help="Rezultatele unei rulari anterioare, pentru comparatie")
+    arguments = parser.parse_args()
+
+    image_directory = os.path.join("input", "images")
+    image_paths = arguments.images or [os.path.join(image_directory, name) for name in sorted(os.listdir(image_directory))]
+    block_sizes = [tuple(int(value) for value in block_size.split("x")) for block_size in arguments.block_sizes]
+
+    results = []
+    for image_path, block_size, ascii_characters, population_size in itertools.product(
+            image_paths, block_sizes, read_charsets(), arguments.population_sizes):
+        results += benchmark_configuration(image_path, block_size, ascii_characters, population_size,
+                                           arguments.generations, arguments.repeat, arguments.font)
+
+    output_directory = os.path.dirname(arguments.output)
+    if output_directory:
+        os.makedirs(output_directory, exist_ok=True)
+    with open(arguments.output, "w", encoding="utf-8") as f:
+        json.dump({"commit": git_commit(), "date": datetime.datetime.now().isoformat(timespec="seconds"),
+                   "results": results}, f, indent=2)
+    logging.info(f"Rezultatele au fost salvate in '{arguments.output}'.")
+
+    if arguments.compare is not None:
+        with open(arguments.compare, "r", encoding="utf-8") as f:
+            compare(results, json.load(f)["results"])
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple
+import numpy as np
+
+# Cheia din fișierul .npz sub care se salvează starea care nu este array (parametri, istorice, stări RNG)
+METADATA_KEY = "__metadata__"
+# Cheia din metadate sub care se salvează identitatea rulării (vezi checkpoint_key)
+RUN_KEY = "run_key"
+
+
+def checkpoint_key(score_table: np.ndarray,
+                   ascii_characters: List[str],
+                   block_size: Tuple[int, int],
+                   **config) -> dict:
+    """
+    Identitatea unei rulări, salvată în checkpoint și verificată la reluare: dimensiunea grilei,
+    dimensiunea alfabetului, hash-ul setului de caractere, dimensiunea blocurilor, hash-ul tabelului de
+    scoruri (care depinde de imagine, font și caractere) și parametrii dați în config
+    (de ex. tipul motorului și funcția de fitness).
+    """
+    return {"grid_shape": list(score_table.shape[:2]),
+            "alphabet_size": len(ascii_characters),
+            "charset_hash": hashlib.sha256("".join(ascii_characters).encode("utf-8")).hexdigest(),
+            "block_size": list(block_size),
+            "score_table_hash": hashlib.sha256(np.ascontiguousarray(score_table).tobytes()).hexdigest(),
+            "config": config}
+
+
+def save_checkpoint(path: str, state: dict, key: Optional[dict] = None) -> None:
+    """
+    Salvează starea rulării într-un fișier .npz comprimat: array-urile direct, restul ca JSON.
+    key (vezi checkpoint_key) este salvat alături de stare, ca reluarea să poată verifica rularea.
+    Fișierul este scris întâi sub un nume temporar, ca un checkpoint întrerupt să nu-l strice pe cel vechi.
+    """
+    arrays = {key: value for key, value in state.items() if isinstance(value, np.ndarray)}
+    metadata = {key: value for key, value in state.items() if not isinstance(value, np.ndarray)}
+    if key is not None:
+        metadata[RUN_KEY] = key
+    arrays[METADATA_KEY] = np.array(json.dumps(metadata))
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary_path = f"{path}.tmp.npz"
+    np.savez_compressed(temporary_path, **arrays)
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(path: str, expected_key: Optional[dict] = None) -> dict:
+    """
+    Încarcă o stare salvată cu save_checkpoint.
+    Dacă este dat expected_key, aruncă ValueError când checkpoint-ul a fost salvat pentru altă rulare
+    (altă imagine, alte caractere, altă dimensiune a blocurilor sau alți parametri).
+    """
+    with np.load(path, allow_pickle=False) as checkpoint:
+        state = {key: checkpoint[key] for key in checkpoint.files if key != METADATA_KEY}
+        state.update(json.loads(str(checkpoint[METADATA_KEY])))
+    saved_key = state.pop(RUN_KEY, None)
+
+    if expected_key is not None:
+        # Cheia așteptată trece prin JSON, ca tuplurile să fie comparate cu listele salvate
+        expected_key = json.loads(json.dumps(expected_key))
+        if saved_key is None:
+            raise ValueError(f"Checkpoint-ul '{path}' nu contine identitatea rularii si nu poate fi verificat.")
+        differences = [name for name in expected_key if saved_key.get(name) != expected_key[name]]
+        if differences:
+            raise ValueError(f"Checkpoint-ul '{path}' este pentru alta rulare (difera: {', '.join(differences)}).")
+    return state
+
+
+class CheckpointWriter:
+    """
+    Scrie checkpoint-uri pe un fir de execuție separat, ca generațiile să nu aștepte după disc.
+    Cel mult un checkpoint este în curs de scriere; starea primită trebuie să fie deja o copie.
+    key (vezi checkpoint_key) este salvat în fiecare checkpoint.
+    """
+
+    def __init__(self, path: str, key: Optional[dict] = None) -> None:
+        self.path = path
+        self.key = key
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending: Optional[Future] = None
+
+    def _wait(self) -> None:
+        """
+        Așteaptă terminarea checkpoint-ului anterior și raportează eventualele erori.
+        """
+        if self._pending is not None:
+            try:
+                self._pending.result()
+            except OSError as e:
+                logging.error(f"Checkpoint-ul nu a putut fi scris in '{self.path}': {e}")
+            self._pending = None
+
+    def save(self, state: dict) -> None:
+        """
+        Programează scrierea stării date.
+        """
+        self._wait()
+        self._pending = self._executor.submit(save_checkpoint, self.path, state, self.key)
+
+    def close(self) -> None:
+        """
+        Așteaptă ultimul checkpoint și oprește firul de scriere.
+        """
+        self._wait()
+        self._executor.shutdown()
@@ -1,7 +1,44 @@
-import random
+import numpy as np
 from typing import List, Tuple, Optional
 
+def genome_dtype(alphabet_size: int) -> np.dtype:
+    """
+    Tipul de date al genomului: uint8 dacă alfabetul încape pe un octet, altfel uint16.
+    """
+    return np.dtype(np.uint8) if alphabet_size <= 256 else np.dtype(np.uint16)
+
+def random_genomes(rng: np.random.Generator, alphabet_size: int, shape: Tuple[int, ...]) -> np.ndarray:
+    """
+    Creează genomi aleatori (indici de caractere) de forma dată.
+    """
+    return rng.integers(0, alphabet_size, size=shape).astype(genome_dtype(alphabet_size))
+
+def mutate_genomes(genomes: np.ndarray, mutation_rate: float, alphabet_size: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Aplică guided mutation pe loc: fiecare genă aleasă cu probabilitatea mutation_rate
+    trece la caracterul vecin (±1) din lista ordonată, circular.
+    Întoarce masca genelor modificate.
+    """
+    mutation_mask = rng.random(genomes.shape) < mutation_rate
+    mutation_count = int(np.count_nonzero(mutation_mask))
+    if mutation_count == 0:
+        return mutation_mask
+
+    steps = rng.choice((-1, 1), size=mutation_count)
+    genomes[mutation_mask] = (genomes[mutation_mask].astype(np.int64) + steps) % alphabet_size
+    return mutation_mask
+
 class Chromosome:
+    # Genomul este o matrice de indici in lista de caractere; restul starii este la nivel de clasa.
+    # block_scores (optional) retine contributia fiecarui bloc la fitness, iar changed blocurile
+    # modificate de la ultima evaluare, pentru evaluarea incrementala.
+    __slots__ = ("genome", "fitness", "block_scores", "changed")
+
+    ascii_character_list: List[str] = []
+    width: int = 0
+    height: int = 0
+    rng: np.random.Generator = np.random.default_rng()
+
     @classmethod
     def set_ascii_character_list(cls, ascii_character_list: List[str]) -> None:
         """
@@ -18,28 +55,54 @@ class Chromosome:
         cls.height = size[1]
 
     @classmethod
-    def __create_random_ascii_character_list(cls) -> list[list[str]]:
+    def set_seed(cls, seed: Optional[int]) -> None:
         """
-        Creează o listă de caractere ASCII aleatorii de dimensiunea specificată.
+        Reinițializează generatorul de numere aleatoare folosit de cromozomi.
         """
+        cls.rng = np.random.default_rng(seed)
 
-        # Construim o matrice de caractere ASCII
-        ascii_image = []
-        for _ in range(cls.height):
-            row = [random.choice(cls.ascii_character_list) for _ in range(cls.width)]
-            ascii_image.append(row)
+    @classmethod
+    def genome_dtype(cls) -> np.dtype:
+        """
+        Tipul de date al genomului pentru lista curentă de caractere.
+        """
+        return genome_dtype(len(cls.ascii_character_list))
 
-        return ascii_image
-        
+    @classmethod
+    def __create_random_genome(cls) -> np.ndarray:
+        """
+        Creează un genom aleatoriu de dimensiunea specificată.
+        """
+        return random_genomes(cls.rng, len(cls.ascii_character_list), (cls.height, cls.width))
 
-    def __init__(self, ascii_image: List[List[str]] = None) -> None:
+    def __init__(self,
+                 ascii_image: List[List[str]] = None,
+                 genome: Optional[np.ndarray] = None,
+                 block_scores: Optional[np.ndarray] = None) -> None:
         """
-        Initializarea cromozomului cu o listă de caractere ASCII și dimensiuni.
+        Initializarea cromozomului dintr-un genom (matrice de indici), dintr-o matrice de caractere ASCII
+        sau aleatoriu, dacă nu este dat niciunul. Genomul dat este copiat, deci array-ul apelantului
+        poate fi refolosit sau modificat fără să schimbe cromozomul.
+        block_scores sunt contribuțiile blocurilor moștenite de la părinți, dacă sunt cunoscute.
         """
-        if ascii_image is None:
-            self.ascii_image = self.__create_random_ascii_character_list()
+        if genome is not None:
+            self.genome = genome.astype(self.genome_dtype(), copy=True)
+        elif ascii_image is not None:
+            character_index = {character: index for index, character in enumerate(self.ascii_character_list)}
+            self.genome = np.array([[character_index[character] for character in row] for row in ascii_image],
+                                   dtype=self.genome_dtype())
         else:
-            self.ascii_image = ascii_image
+            self.genome = self.__create_random_genome()
+        self.fitness = 0.0
+        self.block_scores = block_scores
+        self.changed = None if block_scores is None else np.zeros(self.genome.shape, dtype=bool)
+
+    @property
+    def ascii_image(self) -> List[List[str]]:
+        """
+        Matricea de caractere ASCII corespunzătoare genomului.
+        """
+        return [[self.ascii_character_list[index] for index in row] for row in self.genome.tolist()]
 
     def set_fitness(self, fitness: float) -> None:
         """
@@ -50,27 +113,21 @@ class Chromosome:
     def mutate(self, mutation_rate: float) -> None:
         """
         Efectuează o mutație asupra cromozomului cu o rată de mutație specificată.
+        Folosim guided mutation: fiecare genă mutată trece la caracterul vecin (±1) din lista ordonată.
         """
-        for y in range(self.height):
-            for x in range(self.width):
-                if random.random() < mutation_rate:
-                    # Folosim guided mutation
-                    if (random.random() < 0.5):
-                        if(self.ascii_image[y][x] == self.ascii_character_list[0]):
-                            self.ascii_image[y][x] = self.ascii_character_list[-1]
-                        else:
-                            self.ascii_image[y][x] = self.ascii_character_list[self.ascii_character_list.index(self.ascii_image[y][x]) - 1]
-                    else:
-                        if(self.ascii_image[y][x] == self.ascii_character_list[-1]):
-                            self.ascii_image[y][x] = self.ascii_character_list[0]
-                        else:
-                            self.ascii_image[y][x] = self.ascii_character_list[self.ascii_character_list.index(self.ascii_image[y][x]) + 1]
-                    
+        mutation_mask = mutate_genomes(self.genome, mutation_rate, len(self.ascii_character_list), self.rng)
+        if self.changed is not None:
+            self.changed |= mutation_mask
+
+    def to_text(self) -> str:
+        """
+        Întoarce imaginea ASCII ca text, cu câte o linie pentru fiecare rând.
+        """
+        characters = np.array(self.ascii_character_list)
+        return "\n".join("".join(row) for row in characters[self.genome])
+
     def print(self) -> None:
         """
         Afișează imaginea ASCII generată.
         """
-        for y in range(self.height):
-            for x in range(self.width):
-                print(self.ascii_image[y][x], end="")
-            print()
\ No newline at end of file
+        print(self.to_text())
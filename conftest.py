@@ -0,0 +1,59 @@
+"""
+Date comune pentru teste: o imagine și un set de caractere sintetice, mici, cu tabelul lor de scoruri.
+"""
+import random
+from dataclasses import dataclass
+from typing import List, Tuple
+import numpy as np
+import pytest
+from PIL import Image
+from chromosome import Chromosome
+from fitness import compute_score_table
+
+
+@dataclass
+class SyntheticProblem:
+    """
+    Imaginea, caracterele și tabelul de scoruri folosite de teste.
+    """
+    image: Image.Image
+    characters: List[str]
+    ascii_characters_images: dict[str, Image.Image]
+    block_size: Tuple[int, int]
+    ascii_art_size: Tuple[int, int]
+    score_table: np.ndarray
+
+
+@pytest.fixture
+def problem() -> SyntheticProblem:
+    """
+    Problema sintetică, cu generatoarele aleatoare ale clasei Chromosome inițializate determinist.
+    """
+    rng = np.random.default_rng(0)
+    characters = list("abcdefghij")
+    block_size = (4, 6)
+    ascii_art_size = (7, 5)
+    block_width, block_height = block_size
+    ascii_width, ascii_height = ascii_art_size
+    image = Image.fromarray(rng.integers(0, 256, (ascii_height * block_height, ascii_width * block_width),
+                                         dtype=np.uint8))
+    ascii_characters_images = {character: Image.fromarray(rng.integers(0, 256, (block_height, block_width),
+                                                                       dtype=np.uint8))
+                               for character in characters}
+    score_table = compute_score_table(image, ascii_characters_images, block_size, ascii_art_size)
+
+    Chromosome.set_ascii_character_list(characters)
+    Chromosome.set_size(ascii_art_size)
+    Chromosome.set_seed(0)
+    random.seed(0)
+    return SyntheticProblem(image, characters, ascii_characters_images, block_size, ascii_art_size, score_table)
+
+
+@pytest.fixture
+def ga_parameters() -> dict:
+    """
+    Parametrii algoritmului genetic pentru rulările scurte din teste.
+    """
+    return dict(mutation_rate=0.1, base_mutation_rate=0.06, max_mutation_rate=0.2, epsilon=0.0001,
+                past_generation_count=10, introduce_new_chromosomes_interval=4, new_chromosomes_percentage=0.25,
+                verbose=False)
@@ -0,0 +1,120 @@
+import logging
+import time
+from typing import Optional
+
+# Motivele pentru care o rulare se poate opri
+STOP_GENERATION_COUNT = "generation_count"  # s-au executat toate generațiile
+STOP_TARGET_FITNESS = "target_fitness"  # cel mai bun fitness a atins ținta
+STOP_STAGNATION = "stagnation"  # cel mai bun fitness nu s-a îmbunătățit în ultimele generații
+STOP_TIME_BUDGET = "time_budget"  # s-a epuizat timpul alocat
+STOP_EVALUATION_BUDGET = "evaluation_budget"  # s-a epuizat numărul de evaluări alocat
+STOP_EXACT = "exact"  # fitness-ul este separabil și a fost rezolvat exact, fără algoritmul genetic
+
+
+class ConvergenceController:
+    """
+    Decide când se oprește algoritmul genetic înainte de generation_count și, opțional, adaptează
+    dimensiunea populației: o mărește când cel mai bun fitness stagnează (mai multă diversitate)
+    și o micșorează treptat cât timp acesta se îmbunătățește (generații mai ieftine).
+    Condițiile lăsate None sunt dezactivate; motivul opririi rămâne în stop_reason.
+    """
+
+    def __init__(self,
+                 target_fitness: Optional[float] = None,
+                 stagnation_generations: Optional[int] = None,
+                 time_budget_seconds: Optional[float] = None,
+                 evaluation_budget: Optional[int] = None,
+                 min_improvement: float = 0.0,
+                 min_population_size: Optional[int] = None,
+                 max_population_size: Optional[int] = None,
+                 growth_patience: int = 10,
+                 growth_factor: float = 1.5,
+                 shrink_factor: float = 0.95) -> None:
+        self.target_fitness = target_fitness
+        self.stagnation_generations = stagnation_generations
+        self.time_budget_seconds = time_budget_seconds
+        self.evaluation_budget = evaluation_budget
+        self.min_improvement = min_improvement
+        self.min_population_size = min_population_size
+        self.max_population_size = max_population_size
+        self.growth_patience = growth_patience
+        self.growth_factor = growth_factor
+        self.shrink_factor = shrink_factor
+
+        self.best_fitness = float("-inf")
+        self.generations_without_improvement = 0
+        self.elapsed_seconds = 0.0
+        self.stop_reason: Optional[str] = None
+        self._start_time: Optional[float] = None
+        self._improved = False
+
+    def start(self) -> None:
+        """
+        Pornește cronometrul bugetului de timp (continuând timpul deja consumat, la reluare).
+        """
+        self._start_time = time.perf_counter() - self.elapsed_seconds
+
+    def update(self, best_fitness: float, evaluation_count: int) -> Optional[str]:
+        """
+        Înregistrează cel mai bun fitness al generației încheiate și numărul total de evaluări.
+        Întoarce motivul opririi sau None dacă rularea continuă.
+        """
+        if self._start_time is None:
+            self.start()
+        self.elapsed_seconds = time.perf_counter() - self._start_time
+
+        self._improved = best_fitness > self.best_fitness + self.min_improvement
+        if self._improved:
+            self.best_fitness = best_fitness
+            self.generations_without_improvement = 0
+        else:
+            self.best_fitness = max(self.best_fitness, best_fitness)
+            self.generations_without_improvement += 1
+
+        if self.target_fitness is not None and self.best_fitness >= self.target_fitness:
+            self.stop_reason = STOP_TARGET_FITNESS
+        elif self.stagnation_generations is not None and self.generations_without_improvement >= self.stagnation_generations:
+            self.stop_reason = STOP_STAGNATION
+        elif self.time_budget_seconds is not None and self.elapsed_seconds >= self.time_budget_seconds:
+            self.stop_reason = STOP_TIME_BUDGET
+        elif self.evaluation_budget is not None and evaluation_count >= self.evaluation_budget:
+            self.stop_reason = STOP_EVALUATION_BUDGET
+        return self.stop_reason
+
+    def population_size(self, population_size: int) -> int:
+        """
+        Dimensiunea populației pentru generația următoare, pornind de la cea curentă.
+        Fără min_population_size și max_population_size dimensiunea nu se schimbă.
+        """
+        if self.min_population_size is None or self.max_population_size is None:
+            return population_size
+
+        if self._improved:
+            return max(self.min_population_size, int(population_size * self.shrink_factor))
+        if self.generations_without_improvement > 0 and self.generations_without_improvement % self.growth_patience == 0:
+            return min(self.max_population_size, int(population_size * self.growth_factor) + 1)
+        return population_size
+
+    def finish(self, generation: int) -> None:
+        """
+        Marchează sfârșitul rulării și raportează motivul opririi.
+        """
+        if self.stop_reason is None:
+            self.stop_reason = STOP_GENERATION_COUNT
+        logging.info(f"Rularea s-a oprit la generatia {generation} ({self.stop_reason}); cel mai bun fitness "
+                     f"{self.best_fitness:.4f}, {self.elapsed_seconds:.1f} s.")
+
+    def get_state(self) -> dict:
+        """
+        Starea controlerului, pentru checkpoint.
+        """
+        return {"best_fitness": self.best_fitness, "generations_without_improvement": self.generations_without_improvement,
+                "elapsed_seconds": self.elapsed_seconds}
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restaurează starea salvată cu get_state.
+        """
+        self.best_fitness = state["best_fitness"]
+        self.generations_without_improvement = state["generations_without_improvement"]
+        self.elapsed_seconds = state["elapsed_seconds"]
@@ -0,0 +1,102 @@
+import numpy as np
+from PIL import Image
+
+
+def image_to_blocks(image_array: np.ndarray,
+                    block_size: tuple[int, int],
+                    ascii_art_size: tuple[int, int]) -> np.ndarray:
+    """
+    Împarte imaginea (sub formă de array) în blocuri de dimensiunea unui caracter.
+    Rezultatul este un view de forma (H, W, block_height, block_width), fără copierea pixelilor.
+    """
+    block_width, block_height = block_size
+    ascii_width, ascii_height = ascii_art_size
+
+    # Păstrăm doar zona acoperită de grila ASCII
+    image_array = image_array[:ascii_height * block_height, :ascii_width * block_width]
+
+    return image_array.reshape(ascii_height, block_height, ascii_width, block_width).swapaxes(1, 2)
+
+
+def stack_character_images(ascii_characters_images: dict[str, Image.Image]) -> np.ndarray:
+    """
+    Construiește un array de forma (G, block_height, block_width) cu imaginile caracterelor,
+    în ordinea din dicționar (aceeași ordine ca lista de caractere).
+    """
+    return np.stack([np.array(character_image, dtype=np.uint8)
+                     for character_image in ascii_characters_images.values()])
+
+
+def compute_score_table(image: Image.Image,
+                        ascii_characters_images: dict[str, Image.Image],
+                        block_size: tuple[int, int],
+                        ascii_art_size: tuple[int, int]) -> np.ndarray:
+    """
+    Precalculează scorul fiecărei perechi (bloc, caracter).
+    Rezultatul are forma (H, W, G), iar scor[y, x, g] este exact valoarea întoarsă de
+    image_zone_to_character_similarity pentru blocul (x, y) și caracterul g.
+    """
+    blocks = image_to_blocks(np.array(image, dtype=np.uint8), block_size, ascii_art_size)
+    glyphs = stack_character_images(ascii_characters_images)
+
+    ascii_width, ascii_height = ascii_art_size
+    score_table = np.empty((ascii_height, ascii_width, len(glyphs)), dtype=np.float64)
+    normalization = glyphs[0].size * 255.0
+
+    for index, glyph in enumerate(glyphs):
+        # Diferența se face pe uint8, exact ca în metrica L1 pe blocuri
+        difference = glyph - blocks
+        score_table[:, :, index] = difference.sum(axis=(2, 3), dtype=np.uint64) / normalization
+
+    return score_table
+
+
+def block_scores(score_table: np.ndarray, genomes: np.ndarray) -> np.ndarray:
+    """
+    Extrage din tabelul de scoruri contribuția fiecărui bloc pentru unul sau mai mulți genomi.
+    genomes are forma (..., H, W) și conține indici de caractere.
+    """
+    ascii_height, ascii_width, _ = score_table.shape
+    rows = np.arange(ascii_height)[:, None]
+    columns = np.arange(ascii_width)[None, :]
+
+    return score_table[rows, columns, genomes]
+
+
+def table_fitness(score_table: np.ndarray, genomes: np.ndarray) -> np.ndarray | float:
+    """
+    Calculează fitness-ul (media scorurilor pe blocuri) pentru unul sau mai mulți genomi,
+    folosind tabelul precalculat.
+    """
+    return block_scores(score_table, genomes).mean(axis=(-2, -1))
+
+
+def best_genome(score_table: np.ndarray) -> np.ndarray:
+    """
+    Întoarce genomul optim pentru tabelul dat: cel mai bun caracter pentru fiecare bloc.
+    """
+    return score_table.argmax(axis=2)
+
+
+def table_scores_at(score_table: np.ndarray,
+                    rows: np.ndarray,
+                    columns: np.ndarray,
+                    glyph_indices: np.ndarray) -> np.ndarray:
+    """
+    Scorurile blocurilor (rows[i], columns[i]) pentru caracterele glyph_indices[i], din tabel.
+    """
+    return score_table[rows, columns, glyph_indices]
+
+
+def pixel_scores_at(blocks: np.ndarray,
+                    glyphs: np.ndarray,
+                    rows: np.ndarray,
+                    columns: np.ndarray,
+                    glyph_indices: np.ndarray) -> np.ndarray:
+    """
+    Scorurile blocurilor (rows[i], columns[i]) pentru caracterele glyph_indices[i],
+    calculate direct din pixeli. Folosit la evaluarea incrementală, unde se recalculează
+    doar blocurile modificate.
+    """
+    difference = glyphs[glyph_indices] - blocks[rows, columns]
+    return difference.sum(axis=(-2, -1), dtype=np.uint64) / (glyphs[0].size * 255.0)
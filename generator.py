@@ -0,0 +1,223 @@
+import dataclasses
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from functools import partial
+from typing import BinaryIO, List, Optional, Tuple, Union
+import numpy as np
+from PIL import Image
+from ascii_art import preprocess_image, get_ascii_characters
+from chromosome import genome_dtype
+from convergence import ConvergenceController, STOP_EXACT
+from fitness import compute_score_table, table_fitness, best_genome, image_to_blocks, table_scores_at
+from glyph_atlas import GlyphAtlas, load_glyph_atlas
+from initialization import initial_genomes
+from local_search import LocalSearch
+from penalties import is_separable, with_penalties
+from population_engine import PopulationEngine, run_genetic_algorithm
+from pyramid import coarse_to_fine_genome
+from ssim_fitness import SSIMEvaluator, combined_fitness
+
+
+@dataclass
+class GeneratorConfig:
+    """
+    Parametrii unei conversii, cu aceleași valori implicite ca scriptul din ascii_art.py.
+    """
+    block_size: Tuple[int, int] = (8, 16)
+    font: str = "DejaVuSansMono.ttf"
+    characters_path: str = os.path.join("input", "characters.txt")
+    max_image_size: Optional[Tuple[int, int]] = None
+    # Funcția de fitness: "l1", "ssim" sau "l1+ssim"
+    fitness_mode: str = "l1"
+    ssim_weight: float = 0.5
+    # Penalizările pentru vecini incoerenți și caractere repetate (0 = dezactivate)
+    coherence_weight: float = 0.0
+    repetition_weight: float = 0.0
+    # "auto" = soluția exactă când fitness-ul este separabil, altfel algoritmul genetic; "exact" sau "ga" o forțează
+    solver: str = "auto"
+    # Inițializarea populației: "random", "greedy", "luminance" sau "pyramid"
+    initialization_strategy: str = "random"
+    seeded_fraction: float = 0.25
+    seed_perturbation_rate: float = 0.05
+    pyramid_factors: Tuple[int, ...] = (4, 2)
+    pyramid_generation_count: int = 100
+    # Căutarea locală (0 = dezactivată) și condițiile de oprire (None = dezactivate)
+    local_search_fraction: float = 0.0
+    local_search_selection: str = "elite"
+    local_search_steps: int = 3
+    target_fitness_fraction: Optional[float] = None
+    stagnation_generations: Optional[int] = None
+    time_budget_seconds: Optional[float] = None
+    evaluation_budget: Optional[int] = None
+    # Parametrii algoritmului genetic
+    population_size: int = 200
+    tournament_size: int = 7
+    generation_count: int = 400
+    mutation_rate: float = 0.1
+    base_mutation_rate: float = 0.06
+    max_mutation_rate: float = 0.2
+    elitism: int = 5
+    epsilon: float = 0.0001
+    past_generation_count: int = 10
+    introduce_new_chromosomes_interval: int = 25
+    new_chromosomes_percentage: float = 0.25
+    seed: Optional[int] = None
+
+    def replace(self, **overrides) -> "GeneratorConfig":
+        """
+        O copie a configurației cu valorile date schimbate (TypeError pentru parametri necunoscuți).
+        """
+        return dataclasses.replace(self, **overrides)
+
+
+@dataclass
+class GenerationResult:
+    """
+    Rezultatul unei conversii.
+    """
+    text: str
+    genome: np.ndarray
+    fitness: float
+    maximum_fitness: float  # fitness-ul L1 al soluției greedy, o limită superioară pentru L1
+    generation_count: int
+    stop_reason: Optional[str]
+    average_fitness_history: List[float] = field(repr=False)
+    best_fitness_history: List[float] = field(repr=False)
+
+
+class AsciiArtGenerator:
+    """
+    API-ul de bibliotecă: convertește imagini în ASCII art cu o configurație dată.
+    Setul de caractere și atlasul lor sunt încărcate o singură dată și păstrate între conversii,
+    deci un generator de lungă durată (de ex. în server.py) plătește costul de pornire o singură dată.
+    Metoda generate poate fi apelată din mai multe fire de execuție.
+    """
+
+    def __init__(self, config: Optional[GeneratorConfig] = None) -> None:
+        self.config = config if config is not None else GeneratorConfig()
+        self._lock = threading.Lock()
+        self._characters: dict[str, List[str]] = {}
+        self._atlases: dict[tuple, Tuple[GlyphAtlas, dict[str, Image.Image]]] = {}
+
+    def characters(self, config: Optional[GeneratorConfig] = None) -> List[str]:
+        """
+        Setul de caractere din fișierul configurației, citit o singură dată.
+        """
+        config = config or self.config
+        with self._lock:
+            if config.characters_path not in self._characters:
+                characters = get_ascii_characters(config.characters_path)
+                if not characters:
+                    raise ValueError(f"Fisierul de caractere '{config.characters_path}' nu contine caractere.")
+                self._characters[config.characters_path] = characters
+            return self._characters[config.characters_path]
+
+    def atlas(self, config: Optional[GeneratorConfig] = None) -> Tuple[GlyphAtlas, dict[str, Image.Image]]:
+        """
+        Atlasul caracterelor pentru configurație și dicționarul caracter -> imagine, încărcate o singură dată.
+        """
+        config = config or self.config
+        characters = self.characters(config)
+        key = (tuple(characters), tuple(config.block_size), config.font)
+        with self._lock:
+            if key not in self._atlases:
+                atlas = load_glyph_atlas(characters, tuple(config.block_size), config.font)
+                self._atlases[key] = (atlas, atlas.images())
+            return self._atlases[key]
+
+    def warm_up(self) -> None:
+        """
+        Încarcă dinainte atlasul configurației implicite, ca prima conversie să nu plătească pentru el.
+        """
+        self.atlas()
+
+    def generate(self, image: Union[str, BinaryIO], **overrides) -> GenerationResult:
+        """
+        Convertește imaginea dată (cale sau fișier binar deschis) în ASCII art.
+        overrides schimbă parametrii configurației doar pentru această conversie.
+        """
+        config = self.config.replace(**overrides) if overrides else self.config
+        block_size = tuple(config.block_size)
+        characters = self.characters(config)
+        atlas, ascii_characters_images = self.atlas(config)
+
+        processed_image = preprocess_image(image, block_size, config.max_image_size)
+        if processed_image is None:
+            raise ValueError("Imaginea nu a putut fi procesata.")
+        ascii_art_size = (processed_image.size[0] // block_size[0], processed_image.size[1] // block_size[1])
+        alphabet_size = len(characters)
+        rng = np.random.default_rng(config.seed)
+
+        score_table = compute_score_table(processed_image, ascii_characters_images, block_size, ascii_art_size)
+        maximum_fitness = float(table_fitness(score_table, best_genome(score_table)))
+        character_array = np.array(characters)
+
+        if config.solver not in ("auto", "exact", "ga"):
+            raise ValueError(f"Solver necunoscut: {config.solver}")
+        separable = is_separable(config.fitness_mode, config.coherence_weight, config.repetition_weight)
+        if config.solver == "exact" or (config.solver == "auto" and separable):
+            # Limitele de oprire (timp, evaluări, țintă, stagnare) nu sunt semnalate: soluția exactă nu le poate depăși
+            ignored_settings = [name for name, ignored in (
+                ("initialization_strategy", config.initialization_strategy != "random"),
+                ("local_search_fraction", config.local_search_fraction > 0)) if ignored]
+            if ignored_settings:
+                logging.warning(f"Solutia exacta ignora: {', '.join(ignored_settings)} "
+                                f"(solver = \"ga\" pentru algoritmul genetic).")
+            genome = best_genome(score_table).astype(genome_dtype(alphabet_size))
+            return GenerationResult("\n".join("".join(row) for row in character_array[genome]), genome,
+                                    maximum_fitness, maximum_fitness, 0, STOP_EXACT, [], [maximum_fitness])
+
+        if config.fitness_mode == "l1":
+            evaluate_genomes = lambda genomes: table_fitness(score_table, genomes)
+        elif config.fitness_mode in ("ssim", "l1+ssim"):
+            ssim_evaluator = SSIMEvaluator(np.array(processed_image), atlas.bitmaps, ascii_art_size)
+            if config.fitness_mode == "ssim":
+                evaluate_genomes = ssim_evaluator
+            else:
+                evaluate_genomes = lambda genomes: combined_fitness(table_fitness(score_table, genomes),
+                                                                    ssim_evaluator(genomes), config.ssim_weight)
+        else:
+            raise ValueError(f"Functie de fitness necunoscuta: {config.fitness_mode}")
+        evaluate_genomes = with_penalties(evaluate_genomes, atlas.luminance, config.coherence_weight,
+                                          config.repetition_weight)
+
+        prior_genome = None
+        if config.initialization_strategy == "pyramid":
+            prior_genome = coarse_to_fine_genome(
+                processed_image, ascii_characters_images, block_size, ascii_art_size, config.pyramid_factors,
+                config.population_size, config.pyramid_generation_count, config.tournament_size, config.elitism,
+                config.mutation_rate, config.base_mutation_rate, config.max_mutation_rate, config.epsilon,
+                config.past_generation_count, config.introduce_new_chromosomes_interval,
+                config.new_chromosomes_percentage, config.seed_perturbation_rate, rng)
+        genomes = initial_genomes(config.initialization_strategy, config.population_size, alphabet_size, ascii_art_size,
+                                  rng, config.seeded_fraction, config.seed_perturbation_rate, score_table=score_table,
+                                  blocks=image_to_blocks(np.array(processed_image), block_size, ascii_art_size),
+                                  luminance=atlas.luminance, prior_genome=prior_genome)
+
+        local_search = None
+        if config.local_search_fraction > 0 and separable:
+            local_search = LocalSearch(partial(table_scores_at, score_table), config.local_search_fraction,
+                                       config.local_search_selection, steps=config.local_search_steps)
+        target_fitness = None
+        if config.target_fitness_fraction is not None and config.fitness_mode == "l1":
+            target_fitness = config.target_fitness_fraction * maximum_fitness
+        controller = ConvergenceController(target_fitness, config.stagnation_generations, config.time_budget_seconds,
+                                           config.evaluation_budget)
+
+        engine = PopulationEngine(evaluate_genomes, config.population_size, alphabet_size, ascii_art_size,
+                                  config.tournament_size, config.elitism, rng=rng, genomes=genomes)
+        average_fitness_history, best_fitness_history, _ = run_genetic_algorithm(
+            engine, config.generation_count, config.mutation_rate, config.base_mutation_rate,
+            config.max_mutation_rate, config.epsilon, config.past_generation_count,
+            config.introduce_new_chromosomes_interval, config.new_chromosomes_percentage, verbose=False,
+            controller=controller, local_search=local_search)
+
+        # Rezultatul este citit direct din motor, fără starea globală a clasei Chromosome
+        best_index = int(engine.fitness.argmax())
+        genome = engine.genomes[best_index].copy()
+        text = "\n".join("".join(row) for row in character_array[genome])
+        return GenerationResult(text, genome, float(engine.fitness[best_index]), maximum_fitness,
+                                len(best_fitness_history), controller.stop_reason,
+                                average_fitness_history, best_fitness_history)
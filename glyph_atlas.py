@@ -0,0 +1,169 @@
+import hashlib
+import json
+import logging
+import os
+from typing import List, Optional
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# Versiunea modului de randare; se schimbă când se modifică modul în care sunt desenate caracterele
+ATLAS_VERSION = 1
+DEFAULT_CACHE_DIRECTORY = os.path.join(".cache", "glyph_atlas")
+
+
+def load_font(font: str, font_size: float) -> ImageFont.ImageFont:
+    """
+    Încarcă fontul TrueType cerut, sau fontul implicit dacă acesta nu poate fi găsit.
+    """
+    try:
+        return ImageFont.truetype(font, size=font_size)
+    except IOError:
+        logging.warning(
+            f"Fontul '{font}' nu a putut fi gasit. Se va folosi fontul implicit.")
+        return ImageFont.load_default()
+
+
+def draw_character(character: str, block_size: tuple[int, int], font: ImageFont.ImageFont) -> Image.Image:
+    """
+    Desenează un caracter centrat, alb pe fundal negru, într-o imagine de dimensiunea unui bloc.
+    """
+    width, height = block_size
+    image = Image.new('L', (width, height), color=0)
+    draw = ImageDraw.Draw(image)
+
+    # Obținem “bounding box” al caracterului la poziția 0,0
+    bbox = draw.textbbox((0, 0), character, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    # Calculăm coordonatele pentru centrare
+    x = (width - text_width) // 2 - bbox[0]
+    y = (height - text_height) // 2 - bbox[1]
+
+    draw.text((x, y), character, fill=255, font=font)
+
+    return image
+
+
+def default_font_size(block_size: tuple[int, int]) -> float:
+    """
+    Dimensiunea fontului folosită implicit pentru un bloc.
+    """
+    return min(block_size) * 1.40
+
+
+class GlyphAtlas:
+    """
+    Imaginile tuturor caracterelor dintr-un set, într-un singur array contiguu de forma
+    (G, block_height, block_width), împreună cu luminozitatea fiecărui caracter.
+    """
+
+    def __init__(self, characters: List[str], bitmaps: np.ndarray) -> None:
+        self.characters = characters
+        self.bitmaps = bitmaps
+        self.luminance = bitmaps.reshape(len(characters), -1).mean(axis=1)
+
+    def luminance_order(self) -> np.ndarray:
+        """
+        Indicii caracterelor ordonați după luminozitate crescătoare (întunecat ➜ luminos).
+        """
+        return np.argsort(self.luminance, kind="stable")
+
+    def sorted_characters(self) -> List[str]:
+        """
+        Caracterele ordonate după luminozitate crescătoare.
+        """
+        return [self.characters[index] for index in self.luminance_order()]
+
+    def images(self) -> dict[str, Image.Image]:
+        """
+        Dicționarul caracter -> imagine, în formatul folosit de funcțiile din ascii_art.
+        """
+        return {character: Image.fromarray(np.asarray(bitmap)) for character, bitmap in zip(self.characters, self.bitmaps)}
+
+
+def render_glyph_atlas(characters: List[str],
+                       block_size: tuple[int, int],
+                       font: str = "arial.ttf",
+                       font_size: Optional[float] = None) -> GlyphAtlas:
+    """
+    Randează toate caracterele, încărcând fontul o singură dată.
+    """
+    loaded_font = load_font(font, font_size if font_size is not None else default_font_size(block_size))
+    bitmaps = np.stack([np.array(draw_character(character, block_size, loaded_font), dtype=np.uint8)
+                        for character in characters])
+    return GlyphAtlas(characters, bitmaps)
+
+
+def atlas_key(characters: List[str],
+              block_size: tuple[int, int],
+              font: str,
+              font_size: Optional[float] = None) -> str:
+    """
+    Cheia din cache a unui atlas: hash-ul fișierului fontului, dimensiunea blocului și a fontului,
+    setul de caractere și versiunea randării.
+    """
+    if os.path.isfile(font):
+        with open(font, "rb") as font_file:
+            font_hash = hashlib.sha256(font_file.read()).hexdigest()
+    else:
+        # Fonturile de sistem (sau cel implicit) sunt identificate doar după nume
+        font_hash = font
+
+    description = json.dumps({
+        "version": ATLAS_VERSION,
+        "font": font_hash,
+        "block_size": list(block_size),
+        "font_size": font_size,
+        "characters": "".join(characters),
+    }, sort_keys=True)
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+def load_glyph_atlas(characters: List[str],
+                     block_size: tuple[int, int],
+                     font: str = "arial.ttf",
+                     font_size: Optional[float] = None,
+                     cache_directory: Optional[str] = DEFAULT_CACHE_DIRECTORY) -> GlyphAtlas:
+    """
+    Întoarce atlasul pentru setul de caractere, fontul și dimensiunea date.
+    Atlasul este randat o singură dată și salvat pe disc ca .npy; la rulările următoare este
+    încărcat prin memory-mapping, fără copiere. cache_directory = None dezactivează cache-ul.
+    """
+    if cache_directory is None:
+        return render_glyph_atlas(characters, block_size, font, font_size)
+
+    key = atlas_key(characters, block_size, font, font_size)
+    bitmaps_path = os.path.join(cache_directory, f"{key}.npy")
+    metadata_path = os.path.join(cache_directory, f"{key}.json")
+
+    if os.path.exists(bitmaps_path) and os.path.exists(metadata_path):
+        try:
+            with open(metadata_path, "r", encoding="utf-8") as metadata_file:
+                metadata = json.load(metadata_file)
+            bitmaps = np.load(bitmaps_path, mmap_mode="r")
+            if metadata["characters"] == "".join(characters) and bitmaps.shape == (len(characters), block_size[1], block_size[0]):
+                return GlyphAtlas(characters, bitmaps)
+            logging.warning(f"Atlasul din cache '{bitmaps_path}' nu corespunde cheii si va fi recreat.")
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Atlasul din cache '{bitmaps_path}' nu a putut fi citit: {e}")
+
+    atlas = render_glyph_atlas(characters, block_size, font, font_size)
+
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        # Scriem în fișiere temporare și le redenumim, ca alte procese să nu vadă un atlas incomplet
+        temporary_bitmaps_path = f"{bitmaps_path}.{os.getpid()}.tmp.npy"
+        np.save(temporary_bitmaps_path, atlas.bitmaps)
+        os.replace(temporary_bitmaps_path, bitmaps_path)
+
+        temporary_metadata_path = f"{metadata_path}.{os.getpid()}.tmp"
+        with open(temporary_metadata_path, "w", encoding="utf-8") as metadata_file:
+            json.dump({"version": ATLAS_VERSION, "font": font, "font_size": font_size,
+                       "block_size": list(block_size), "characters": "".join(characters)},
+                      metadata_file, ensure_ascii=False)
+        os.replace(temporary_metadata_path, metadata_path)
+    except OSError as e:
+        logging.warning(f"Atlasul nu a putut fi salvat in cache: {e}")
+
+    return atlas
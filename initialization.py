@@ -0,0 +1,97 @@
+import logging
+from typing import List, Optional, Tuple
+import numpy as np
+from chromosome import genome_dtype, random_genomes, mutate_genomes
+from fitness import best_genome
+
+
+def perturbed_copies(genome: np.ndarray,
+                     count: int,
+                     perturbation_rate: float,
+                     alphabet_size: int,
+                     rng: np.random.Generator) -> np.ndarray:
+    """
+    count copii ale genomului dat: prima neschimbată, restul cu guided mutation la rata perturbation_rate.
+    """
+    genomes = np.repeat(genome.astype(genome_dtype(alphabet_size))[None], count, axis=0)
+    mutate_genomes(genomes[1:], perturbation_rate, alphabet_size, rng)
+    return genomes
+
+
+def luminance_genome(blocks: np.ndarray, luminance: np.ndarray) -> np.ndarray:
+    """
+    Pentru fiecare bloc alege caracterul cu luminozitatea cea mai apropiată de media blocului.
+    blocks are forma (H, W, block_height, block_width), iar luminance forma (G,).
+    """
+    block_means = blocks.mean(axis=(2, 3))
+    return np.abs(block_means[:, :, None] - luminance[None, None, :]).argmin(axis=2)
+
+
+def load_genome_file(path: str, ascii_characters: List[str], ascii_art_size: Tuple[int, int]) -> Optional[np.ndarray]:
+    """
+    Citește un rezultat salvat anterior (de ex. output/best_ascii_art.txt) ca genom.
+    Întoarce None dacă fișierul lipsește sau nu corespunde dimensiunii și setului de caractere.
+    """
+    ascii_width, ascii_height = ascii_art_size
+    character_index = {character: index for index, character in enumerate(ascii_characters)}
+
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            lines = [line.rstrip("\n") for line in file][:ascii_height]
+    except FileNotFoundError:
+        logging.warning(f"Fisierul '{path}' pentru initializare nu a fost gasit.")
+        return None
+
+    if len(lines) != ascii_height or any(len(line) != ascii_width for line in lines):
+        logging.warning(f"Fisierul '{path}' nu are dimensiunea {ascii_width}x{ascii_height} a imaginii ASCII.")
+        return None
+    if any(character not in character_index for line in lines for character in line):
+        logging.warning(f"Fisierul '{path}' contine caractere care nu sunt in setul curent.")
+        return None
+
+    return np.array([[character_index[character] for character in line] for line in lines],
+                    dtype=genome_dtype(len(ascii_characters)))
+
+
+def initial_genomes(strategy: str,
+                    population_size: int,
+                    alphabet_size: int,
+                    ascii_art_size: Tuple[int, int],
+                    rng: np.random.Generator,
+                    seeded_fraction: float = 0.25,
+                    perturbation_rate: float = 0.05,
+                    score_table: Optional[np.ndarray] = None,
+                    blocks: Optional[np.ndarray] = None,
+                    luminance: Optional[np.ndarray] = None,
+                    prior_genome: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Populația inițială (P, H, W) pentru strategia aleasă:
+    "random" - toți indivizii aleatori;
+    "greedy" - o fracțiune pornește din soluția greedy (argmax din tabelul de scoruri);
+    "luminance" - o fracțiune pornește din caracterele cu luminozitatea cea mai apropiată de blocuri;
+    "file" - o fracțiune pornește dintr-un rezultat anterior (prior_genome);
+    "pyramid" - o fracțiune pornește din rezultatul mărit al unei rulări pe grile micșorate (prior_genome,
+    vezi pyramid.coarse_to_fine_genome).
+    Indivizii porniți dintr-o soluție sunt copii perturbate ale ei; restul sunt aleatori.
+    """
+    ascii_width, ascii_height = ascii_art_size
+    genomes = random_genomes(rng, alphabet_size, (population_size, ascii_height, ascii_width))
+
+    if strategy == "random":
+        return genomes
+    if strategy == "greedy":
+        seed_genome = best_genome(score_table)
+    elif strategy == "luminance":
+        seed_genome = luminance_genome(blocks, luminance)
+    elif strategy in ("file", "pyramid"):
+        seed_genome = prior_genome
+    else:
+        raise ValueError(f"Strategie de initializare necunoscuta: {strategy}")
+
+    if seed_genome is None:
+        logging.warning("Nu exista o solutie de pornire; populatia initiala este aleatoare.")
+        return genomes
+
+    seeded_count = min(population_size, max(1, int(population_size * seeded_fraction)))
+    genomes[:seeded_count] = perturbed_copies(seed_genome, seeded_count, perturbation_rate, alphabet_size, rng)
+    return genomes
@@ -0,0 +1,135 @@
+import cProfile
+import csv
+import io
+import json
+import logging
+import os
+import pstats
+from typing import Optional
+import numpy as np
+
+# Etapele unei generații, în ordinea în care sunt executate (local_search doar dacă este activată)
+PHASES = ("crossover", "mutation", "evaluation", "local_search", "selection", "immigrants")
+
+
+def population_entropy(genomes: np.ndarray, alphabet_size: int) -> float:
+    """
+    Diversitatea populației: entropia (în biți) a distribuției caracterelor pe fiecare celulă,
+    mediată pe toate celulele. 0 înseamnă că toți indivizii sunt identici.
+    """
+    population_size = len(genomes)
+    cells = genomes.reshape(population_size, -1)
+    cell_count = cells.shape[1]
+    counts = np.bincount((np.arange(cell_count) * alphabet_size + cells).ravel(),
+                         minlength=cell_count * alphabet_size).reshape(cell_count, alphabet_size)
+    probabilities = counts / population_size
+    with np.errstate(divide="ignore", invalid="ignore"):
+        entropy = -np.where(probabilities > 0, probabilities * np.log2(probabilities), 0.0).sum(axis=1)
+    return float(entropy.mean())
+
+
+class GenerationObserver:
+    """
+    Interfața observatorilor buclei genetice. Toate metodele sunt opționale.
+    """
+
+    def on_run_start(self) -> None:
+        """
+        Apelată înainte de prima generație a rulării.
+        """
+
+    def on_generation_start(self, generation: int) -> None:
+        """
+        Apelată înainte de prima etapă a generației (numerotate de la 1).
+        """
+
+    def on_generation_end(self, record: dict) -> None:
+        """
+        Apelată la finalul generației, cu măsurătorile ei: timpul fiecărei etapă, numărul de evaluări,
+        diversitatea populației, cel mai bun fitness, fitness-ul mediu și rata de mutație.
+        """
+
+    def on_run_end(self) -> None:
+        """
+        Apelată la finalul rulării, inclusiv când aceasta se oprește cu o excepție.
+        """
+
+
+class MetricsRecorder(GenerationObserver):
+    """
+    Scrie măsurătorile fiecărei generații într-un fișier JSON lines (.jsonl) sau CSV (.csv).
+    Fișierul este deschis la începutul rulării și închis la finalul ei.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.format = "csv" if path.endswith(".csv") else "jsonl"
+        self._file = None
+        self._writer: Optional[csv.DictWriter] = None
+
+    def on_run_start(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8", newline="")
+        self._writer = None
+
+    def on_generation_end(self, record: dict) -> None:
+        if self.format == "jsonl":
+            self._file.write(json.dumps(record) + "\n")
+            return
+
+        # În CSV timpii etapelor devin coloane separate
+        row = {key: value for key, value in record.items() if key != "phase_seconds"}
+        row.update({f"seconds_{phase}": seconds for phase, seconds in record["phase_seconds"].items()})
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(row))
+            self._writer.writeheader()
+        self._writer.writerow(row)
+
+    def on_run_end(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ProfilerObserver(GenerationObserver):
+    """
+    Rulează cProfile pe generațiile din intervalul [start_generation, end_generation] și salvează
+    statisticile în output_path (se pot citi cu pstats sau snakeviz).
+    """
+
+    def __init__(self, start_generation: int, end_generation: int, output_path: str) -> None:
+        self.start_generation = start_generation
+        self.end_generation = end_generation
+        self.output_path = output_path
+        self._profiler = cProfile.Profile()
+        self._active = False
+
+    def on_generation_start(self, generation: int) -> None:
+        if generation == self.start_generation:
+            self._profiler.enable()
+            self._active = True
+
+    def on_generation_end(self, record: dict) -> None:
+        if self._active and record["generation"] >= self.end_generation:
+            self._stop()
+
+    def on_run_end(self) -> None:
+        if self._active:
+            self._stop()
+
+    def _stop(self) -> None:
+        """
+        Oprește profilarea și salvează statisticile.
+        """
+        self._profiler.disable()
+        self._active = False
+        directory = os.path.dirname(self.output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._profiler.dump_stats(self.output_path)
+        logging.info(f"Profilul generatiilor {self.start_generation}-{self.end_generation} a fost salvat in '{self.output_path}'.")
+        summary = io.StringIO()
+        pstats.Stats(self.output_path, stream=summary).sort_stats("cumulative").print_stats(15)
+        logging.debug(summary.getvalue())
@@ -0,0 +1,176 @@
+import logging
+import multiprocessing
+import queue
+from typing import List, Optional, Tuple
+import numpy as np
+from fitness import table_fitness
+from parallel_evaluation import share_array, attach_array
+from population_engine import PopulationEngine, adapt_mutation_rate
+
+
+def migration_targets(island_index: int, island_count: int, topology: str) -> List[int]:
+    """
+    Insulele către care trimite migranți insula dată.
+    "ring": doar următoarea insulă; "all": toate celelalte insule.
+    """
+    if island_count < 2:
+        return []
+    if topology == "ring":
+        return [(island_index + 1) % island_count]
+    if topology == "all":
+        return [index for index in range(island_count) if index != island_index]
+    raise ValueError(f"Topologie necunoscuta: {topology}")
+
+
+def _receive_migrants(inbox, epoch: int, expected_count: int, pending: dict) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Așteaptă migranții pentru o anumită rundă de migrare.
+    Mesajele care aparțin rundelor următoare sunt păstrate în pending.
+    """
+    received = pending.pop(epoch, [])
+    while len(received) < expected_count:
+        message_epoch, genomes, fitness = inbox.get()
+        if message_epoch == epoch:
+            received.append((genomes, fitness))
+        else:
+            pending.setdefault(message_epoch, []).append((genomes, fitness))
+    return received
+
+
+def _run_island(island_index: int,
+                island_count: int,
+                inboxes: list,
+                results,
+                score_table_description: tuple,
+                alphabet_size: int,
+                ascii_art_size: Tuple[int, int],
+                population_size: int,
+                tournament_size: int,
+                elitism: int,
+                generation_count: int,
+                mutation_rate: float,
+                base_mutation_rate: float,
+                max_mutation_rate: float,
+                epsilon: float,
+                past_generation_count: int,
+                migration_interval: int,
+                migration_size: int,
+                topology: str,
+                seed: np.random.SeedSequence) -> None:
+    """
+    Evoluția unei singure insule, într-un proces separat.
+    La fiecare migration_interval generații trimite cei mai buni migration_size indivizi
+    către vecini și înlocuiește cei mai slabi indivizi proprii cu migranții primiți.
+    """
+    shared_memory, score_table = attach_array(score_table_description)
+    try:
+        engine = PopulationEngine(lambda genomes: table_fitness(score_table, genomes),
+                                  population_size, alphabet_size, ascii_art_size,
+                                  tournament_size, elitism, rng=np.random.default_rng(seed))
+        targets = migration_targets(island_index, island_count, topology)
+        source_count = sum(island_index in migration_targets(index, island_count, topology) for index in range(island_count))
+        pending = {}
+
+        average_fitness_history = []
+        best_fitness_history = []
+
+        engine.evaluate()
+        average_fitness_history.append(engine.average_fitness())
+        engine.select_parents()
+
+        for generation in range(generation_count):
+            engine.generate_next_generation()
+            engine.mutate(mutation_rate)
+            engine.evaluate()
+            average_fitness_history.append(engine.average_fitness())
+
+            if targets and (generation + 1) % migration_interval == 0:
+                epoch = (generation + 1) // migration_interval
+                emigrants = np.argsort(-engine.fitness, kind="stable")[:migration_size]
+                for target in targets:
+                    inboxes[target].put((epoch, engine.genomes[emigrants].copy(), engine.fitness[emigrants].copy()))
+
+                migrants = _receive_migrants(inboxes[island_index], epoch, source_count, pending)
+                migrant_genomes = np.concatenate([genomes for genomes, _ in migrants])
+                migrant_fitness = np.concatenate([fitness for _, fitness in migrants])
+                # Migranții înlocuiesc cei mai slabi indivizi ai insulei
+                worst = np.argsort(engine.fitness, kind="stable")[:len(migrant_genomes)]
+                engine.genomes[worst] = migrant_genomes[:len(worst)]
+                engine.fitness[worst] = migrant_fitness[:len(worst)]
+                logging.debug(f"Insula {island_index}: {len(worst)} migranti primiti la generatia {generation + 1}")
+
+            engine.select_parents()
+            best_fitness_history.append(float(engine.fitness.max()))
+
+            mutation_rate = adapt_mutation_rate(mutation_rate, generation, average_fitness_history, epsilon,
+                                                past_generation_count, base_mutation_rate, max_mutation_rate)
+
+        best_index = int(engine.fitness.argmax())
+        results.put((island_index, engine.genomes[best_index].copy(), float(engine.fitness[best_index]),
+                     average_fitness_history, best_fitness_history))
+    finally:
+        del score_table
+        shared_memory.close()
+
+
+def run_island_model(score_table: np.ndarray,
+                     island_count: int,
+                     population_size: int,
+                     generation_count: int,
+                     tournament_size: int = 5,
+                     elitism: int = 3,
+                     mutation_rate: float = 0.1,
+                     base_mutation_rate: float = 0.06,
+                     max_mutation_rate: float = 0.2,
+                     epsilon: float = 0.0001,
+                     past_generation_count: int = 10,
+                     migration_interval: int = 20,
+                     migration_size: int = 5,
+                     topology: str = "ring",
+                     seed: Optional[int] = None
+                     ) -> Tuple[np.ndarray, float, List[List[float]], List[List[float]]]:
+    """
+    Rulează island_count sub-populații de câte population_size indivizi, fiecare într-un proces separat,
+    cu migrare periodică pe topologia aleasă ("ring" sau "all").
+    Tabelul de scoruri este pus o singură dată în memorie partajată.
+    Întoarce cel mai bun genom global, fitness-ul lui și istoricele (mediu și cel mai bun) pentru fiecare insulă.
+    """
+    ascii_height, ascii_width, alphabet_size = score_table.shape
+    seeds = np.random.SeedSequence(seed).spawn(island_count)
+
+    shared_memory, score_table_description = share_array(np.ascontiguousarray(score_table))
+    try:
+        inboxes = [multiprocessing.Queue() for _ in range(island_count)]
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=_run_island,
+                                             args=(index, island_count, inboxes, results, score_table_description,
+                                                   alphabet_size, (ascii_width, ascii_height), population_size,
+                                                   tournament_size, elitism, generation_count, mutation_rate,
+                                                   base_mutation_rate, max_mutation_rate, epsilon,
+                                                   past_generation_count, migration_interval, migration_size,
+                                                   topology, seeds[index]))
+                     for index in range(island_count)]
+        for process in processes:
+            process.start()
+
+        # Rezultatele se citesc înainte de join, altfel procesele pot rămâne blocate pe coadă
+        island_results = []
+        while len(island_results) < island_count:
+            try:
+                island_results.append(results.get(timeout=1.0))
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    for process in processes:
+                        process.terminate()
+                    raise RuntimeError("Una dintre insule s-a oprit cu eroare.")
+        island_results.sort(key=lambda result: result[0])
+        for process in processes:
+            process.join()
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+    best_island = max(island_results, key=lambda result: result[2])
+    average_fitness_histories = [result[3] for result in island_results]
+    best_fitness_histories = [result[4] for result in island_results]
+    return best_island[1], best_island[2], average_fitness_histories, best_fitness_histories
@@ -0,0 +1,81 @@
+from typing import Callable, Tuple
+import numpy as np
+
+
+class LocalSearch:
+    """
+    Parametrii pasului memetic: după evaluare, o parte din populație (cei mai buni indivizi, "elite",
+    sau indivizi aleși aleatoriu, "random") este îmbunătățită prin hill-climbing pe fiecare bloc.
+    score_blocks(rows, columns, glyph_indices) întoarce scorurile blocurilor, de ex. table_scores_at
+    din fitness.py aplicat pe tabelul de scoruri.
+    """
+
+    def __init__(self,
+                 score_blocks: Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray],
+                 fraction: float = 0.05,
+                 selection: str = "elite",
+                 radius: int = 1,
+                 steps: int = 3) -> None:
+        if selection not in ("elite", "random"):
+            raise ValueError(f"Selectie necunoscuta pentru cautarea locala: {selection}")
+        self.score_blocks = score_blocks
+        self.fraction = fraction
+        self.selection = selection
+        self.radius = radius
+        self.steps = steps
+
+    def count(self, population_size: int) -> int:
+        """
+        Numărul de indivizi rafinați într-o generație.
+        """
+        return min(population_size, max(1, int(population_size * self.fraction)))
+
+    def refine(self, genomes: np.ndarray, alphabet_size: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Aplică hill_climb cu parametrii acestui pas.
+        """
+        return hill_climb(genomes, self.score_blocks, alphabet_size, self.radius, self.steps)
+
+
+def hill_climb(genomes: np.ndarray,
+               score_blocks: Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray],
+               alphabet_size: int,
+               radius: int = 1,
+               steps: int = 3) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Hill-climbing vectorizat pe toate blocurile tuturor genomilor (N, H, W) deodată: la fiecare pas,
+    fiecare bloc încearcă caracterele aflate la cel mult radius poziții în setul ordonat după
+    luminozitate (aceiași vecini ca la mutație) și îl păstrează pe cel mai bun, dacă este mai bun
+    decât cel curent. Blocurile neîmbunătățite la un pas sunt optime local și nu mai sunt încercate.
+    Întoarce genomii rafinați, scorurile blocurilor lor (N, H, W) și numărul de evaluări echivalente
+    (blocuri evaluate împărțit la numărul de blocuri dintr-un genom).
+    """
+    shape = genomes.shape
+    rows = np.broadcast_to(np.arange(shape[1])[None, :, None], shape).ravel()
+    columns = np.broadcast_to(np.arange(shape[2])[None, None, :], shape).ravel()
+    glyphs = genomes.ravel().astype(np.int64)
+    scores = np.asarray(score_blocks(rows, columns, glyphs), dtype=np.float64)
+    block_evaluations = glyphs.size
+
+    offsets = [sign * distance for distance in range(1, radius + 1) for sign in (-1, 1)]
+    active = np.arange(glyphs.size)
+    for _ in range(steps):
+        if active.size == 0:
+            break
+        best_glyphs = glyphs[active]
+        best_scores = scores[active]
+        for offset in offsets:
+            candidates = (glyphs[active] + offset) % alphabet_size
+            candidate_scores = score_blocks(rows[active], columns[active], candidates)
+            better = candidate_scores > best_scores
+            best_glyphs = np.where(better, candidates, best_glyphs)
+            best_scores = np.where(better, candidate_scores, best_scores)
+        block_evaluations += active.size * len(offsets)
+
+        improved = best_scores > scores[active]
+        active = active[improved]
+        glyphs[active] = best_glyphs[improved]
+        scores[active] = best_scores[improved]
+
+    return (glyphs.reshape(shape).astype(genomes.dtype), scores.reshape(shape),
+            block_evaluations // (shape[1] * shape[2]))
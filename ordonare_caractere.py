@@ -1,15 +1,4 @@
-from PIL import Image, ImageDraw, ImageFont
-import numpy as np
-
-def get_luminance(char: str, font: ImageFont.FreeTypeFont, size: tuple[int, int]) -> float:
-    image = Image.new('L', size, color=0)
-    draw = ImageDraw.Draw(image)
-    bbox = draw.textbbox((0, 0), char, font=font)
-    x = (size[0] - (bbox[2] - bbox[0])) // 2 - bbox[0]
-    y = (size[1] - (bbox[3] - bbox[1])) // 2 - bbox[1]
-    draw.text((x, y), char, fill=255, font=font)
-    arr = np.array(image, dtype=np.uint8)
-    return arr.mean()
+from glyph_atlas import load_glyph_atlas
 
 # Set de caractere (poți schimba dacă vrei)
 characters = list(r"""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~""")
@@ -17,19 +6,13 @@ characters = list(r"""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~""")
 # Parametri imagine
 block_size = (16, 16)
 
-# Încarcă fontul (poți schimba cu calea completă dacă nu merge implicit)
-try:
-    font = ImageFont.truetype("DejaVuSansMono.ttf", size=16)
-except:
-    font = ImageFont.load_default()
-
-# Calculează luminozitatea pentru fiecare caracter
-char_luminance = [(char, get_luminance(char, font, block_size)) for char in characters]
+# Încarcă atlasul caracterelor (randat o singură dată, apoi citit din cache)
+# Poți schimba fontul cu calea completă dacă nu merge implicit
+atlas = load_glyph_atlas(characters, block_size, "DejaVuSansMono.ttf", font_size=16)
 
 # Sortează după luminozitate crescătoare (întunecat ➜ luminos)
-sorted_chars = sorted(char_luminance, key=lambda x: x[1])
+sorted_string = ''.join(atlas.sorted_characters())
 
 # Afișează rezultatul
-sorted_string = ''.join(char for char, lum in sorted_chars)
 print("Caractere ordonate dupa luminozitate:")
 print(sorted_string)
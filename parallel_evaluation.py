@@ -0,0 +1,112 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+import numpy as np
+from fitness import table_fitness
+
+# Starea fiecărui proces worker: array-urile atașate din memoria partajată
+_worker_state: dict = {}
+
+
+def share_array(array: np.ndarray) -> tuple[SharedMemory, tuple]:
+    """
+    Copiază un array într-un bloc nou de memorie partajată.
+    Întoarce blocul și descrierea (nume, formă, tip) necesară pentru atașare în workeri.
+    """
+    shared_memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shared_memory.buf)[...] = array
+    return shared_memory, (shared_memory.name, array.shape, array.dtype.str)
+
+
+def attach_array(description: tuple) -> tuple[SharedMemory, np.ndarray]:
+    """
+    Atașează într-un alt proces un array din memoria partajată, fără copiere.
+    Blocul de memorie trebuie păstrat în viață cât timp este folosit array-ul.
+    """
+    name, shape, dtype = description
+    shared_memory = SharedMemory(name=name)
+    return shared_memory, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shared_memory.buf)
+
+
+def _attach_worker_array(description: tuple) -> np.ndarray:
+    """
+    Atașează în worker un array din memoria partajată și păstrează referința la bloc.
+    """
+    shared_memory, array = attach_array(description)
+    _worker_state.setdefault("shared_memory", []).append(shared_memory)
+    return array
+
+
+def _initialize_worker(score_table_description: tuple) -> None:
+    """
+    Inițializarea unui worker: atașează tabelul de scoruri (bloc, caracter).
+    """
+    _worker_state["score_table"] = _attach_worker_array(score_table_description)
+
+
+def _evaluate_chunk(genomes: np.ndarray) -> np.ndarray:
+    """
+    Evaluează în worker un grup de genomi și întoarce fitness-ul fiecăruia.
+    """
+    return table_fitness(_worker_state["score_table"], genomes)
+
+
+class ParallelEvaluator:
+    """
+    Evaluează fitness-ul genomilor într-un grup de procese.
+    Tabelul de scoruri este pus o singură dată în memorie partajată, iar workerii calculează aceeași
+    medie ca table_fitness; către workeri se trimit doar genomii, iar înapoi vin doar valorile de fitness.
+    Costul comunicării face ca acest mod să merite doar pentru populații și grile mari.
+    """
+
+    def __init__(self,
+                 score_table: np.ndarray,
+                 worker_count: Optional[int] = None,
+                 chunk_size: Optional[int] = None) -> None:
+        """
+        score_table are forma (H, W, G), ca în compute_score_table.
+        Dacă worker_count nu este dat se folosesc toate procesoarele, iar chunk_size se alege automat.
+        """
+        self.worker_count = worker_count or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+        self._score_table_memory, score_table_description = share_array(
+            np.ascontiguousarray(score_table, dtype=np.float64))
+        self._pool = ProcessPoolExecutor(max_workers=self.worker_count,
+                                         initializer=_initialize_worker,
+                                         initargs=(score_table_description,))
+
+    def _chunk_size(self, genome_count: int) -> int:
+        """
+        Alege numărul de genomi trimiși într-un singur task: în jur de 4 task-uri pentru fiecare
+        worker, ca încărcarea să se echilibreze fără prea mult overhead de comunicare.
+        """
+        if self.chunk_size is not None:
+            return self.chunk_size
+        return max(1, math.ceil(genome_count / (self.worker_count * 4)))
+
+    def __call__(self, genomes: np.ndarray) -> np.ndarray:
+        """
+        Evaluează un array (N, H, W) de genomi și întoarce fitness-ul fiecăruia.
+        """
+        if len(genomes) == 0:
+            return np.empty(0)
+        chunk_size = self._chunk_size(len(genomes))
+        chunks = [genomes[start:start + chunk_size] for start in range(0, len(genomes), chunk_size)]
+        return np.concatenate(list(self._pool.map(_evaluate_chunk, chunks)))
+
+    def close(self) -> None:
+        """
+        Oprește workerii și eliberează memoria partajată.
+        """
+        self._pool.shutdown()
+        self._score_table_memory.close()
+        self._score_table_memory.unlink()
+
+    def __enter__(self) -> "ParallelEvaluator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,55 @@
+from typing import Callable
+import numpy as np
+
+
+def neighbor_incoherence(genomes: np.ndarray, luminance: np.ndarray) -> np.ndarray:
+    """
+    Cât de abrupt se schimbă luminozitatea între caracterele vecine (orizontal și vertical), pentru
+    genomi de forma (N, H, W): media diferențelor absolute de luminozitate, în [0, 1].
+    """
+    glyph_luminance = luminance[genomes]
+    horizontal = np.abs(np.diff(glyph_luminance, axis=2)).sum(axis=(1, 2))
+    vertical = np.abs(np.diff(glyph_luminance, axis=1)).sum(axis=(1, 2))
+    _, height, width = genomes.shape
+    pair_count = height * (width - 1) + (height - 1) * width
+    return (horizontal + vertical) / (max(pair_count, 1) * 255.0)
+
+
+def repetition_rate(genomes: np.ndarray) -> np.ndarray:
+    """
+    Fracțiunea perechilor de caractere alăturate pe rând care sunt identice, pentru genomi (N, H, W).
+    """
+    if genomes.shape[2] < 2:
+        return np.zeros(len(genomes))
+    return (genomes[:, :, 1:] == genomes[:, :, :-1]).mean(axis=(1, 2))
+
+
+def is_separable(fitness_mode: str, coherence_weight: float = 0.0, repetition_weight: float = 0.0) -> bool:
+    """
+    Dacă fitness-ul este o sumă de termeni independenți pe blocuri. În acest caz optimul global este
+    exact argmax-ul pe fiecare bloc din tabelul de scoruri, iar algoritmul genetic nu mai este necesar.
+    SSIM (ferestre care acoperă mai multe blocuri) și penalizările pe vecini nu sunt separabile.
+    """
+    return fitness_mode == "l1" and coherence_weight == 0 and repetition_weight == 0
+
+
+def with_penalties(evaluate_genomes: Callable[[np.ndarray], np.ndarray],
+                   luminance: np.ndarray,
+                   coherence_weight: float = 0.0,
+                   repetition_weight: float = 0.0) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Funcția de evaluare din care se scad penalizările ponderate pentru vecinii incoerenți și pentru
+    caracterele repetate. Cu ponderi nule întoarce funcția neschimbată.
+    """
+    if coherence_weight == 0 and repetition_weight == 0:
+        return evaluate_genomes
+
+    def evaluate(genomes: np.ndarray) -> np.ndarray:
+        fitness = np.asarray(evaluate_genomes(genomes), dtype=np.float64)
+        if coherence_weight:
+            fitness = fitness - coherence_weight * neighbor_incoherence(genomes, luminance)
+        if repetition_weight:
+            fitness = fitness - repetition_weight * repetition_rate(genomes)
+        return fitness
+
+    return evaluate
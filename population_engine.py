@@ -0,0 +1,349 @@
+import logging
+import time
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+from chromosome import Chromosome, genome_dtype, random_genomes, mutate_genomes
+from instrumentation import GenerationObserver, population_entropy
+from convergence import ConvergenceController
+from local_search import LocalSearch
+from reporting import ProgressReporter, VERBOSITY_PREVIEW, VERBOSITY_QUIET
+
+
+def adapt_mutation_rate(mutation_rate: float,
+                        generation: int,
+                        average_fitness_history: List[float],
+                        epsilon: float,
+                        past_generation_count: int,
+                        base_mutation_rate: float,
+                        max_mutation_rate: float) -> float:
+    """
+    Ajustează rata de mutație: crește când fitness-ul mediu stagnează în ultimele
+    past_generation_count generații și scade treptat spre rata de bază în rest.
+    """
+    if generation > past_generation_count and abs(average_fitness_history[-1] - average_fitness_history[-past_generation_count]) <= epsilon:
+        return min(mutation_rate + 0.02, max_mutation_rate)
+    return max(mutation_rate - 0.005, base_mutation_rate)
+
+
+class PopulationEngine:
+    """
+    Motor de populație care ține toți indivizii într-un singur array de forma (P, H, W)
+    împreună cu vectorul lor de fitness. Selecția, crossover-ul, mutația, introducerea de
+    cromozomi noi și evaluarea se fac pe toată generația deodată, cu operații NumPy.
+    """
+
+    def __init__(self,
+                 evaluate_genomes: Optional[Callable[[np.ndarray], np.ndarray]],
+                 population_size: int,
+                 alphabet_size: int,
+                 ascii_art_size: Tuple[int, int],
+                 tournament_size: int = 5,
+                 elitism: int = 3,
+                 rng: Optional[np.random.Generator] = None,
+                 genomes: Optional[np.ndarray] = None,
+                 score_blocks: Optional[Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]] = None) -> None:
+        """
+        evaluate_genomes primește un array (N, H, W) de genomi și întoarce fitness-ul fiecăruia.
+        Dacă este dat score_blocks(rows, columns, glyph_indices), evaluarea devine incrementală:
+        se păstrează contribuția fiecărui bloc și se recalculează doar blocurile modificate.
+        """
+        self.evaluate_genomes = evaluate_genomes
+        self.score_blocks = score_blocks
+        self.population_size = population_size
+        self.alphabet_size = alphabet_size
+        self.width, self.height = ascii_art_size
+        self.tournament_size = tournament_size
+        self.elitism = elitism
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        if genomes is None:
+            genomes = random_genomes(self.rng, alphabet_size, (population_size, self.height, self.width))
+        self.genomes = genomes.astype(genome_dtype(alphabet_size), copy=False)
+        self.fitness = np.zeros(population_size, dtype=np.float64)
+        self.parents = self.genomes
+
+        # Starea evaluării incrementale: contribuțiile blocurilor și blocurile modificate
+        self.block_scores: Optional[np.ndarray] = None
+        self.parent_block_scores: Optional[np.ndarray] = None
+        self.changed: Optional[np.ndarray] = None
+
+    def population_genomes(self) -> np.ndarray:
+        """
+        Genomii populației curente, ca array (P, H, W).
+        """
+        return self.genomes
+
+    def get_state(self) -> dict:
+        """
+        Copia stării motorului (populație, părinți, evaluare incrementală, generator aleator), pentru checkpoint.
+        """
+        state = {"genomes": self.genomes.copy(), "fitness": self.fitness.copy(), "parents": self.parents.copy(),
+                 "rng_state": self.rng.bit_generator.state, "population_size": self.population_size}
+        for name in ("block_scores", "parent_block_scores", "changed"):
+            if getattr(self, name) is not None:
+                state[name] = getattr(self, name).copy()
+        return state
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restaurează starea salvată cu get_state.
+        """
+        self.genomes = state["genomes"].astype(genome_dtype(self.alphabet_size), copy=False)
+        self.fitness = state["fitness"]
+        self.parents = state["parents"].astype(genome_dtype(self.alphabet_size), copy=False)
+        self.rng.bit_generator.state = state["rng_state"]
+        self.population_size = int(state.get("population_size", self.population_size))
+        for name in ("block_scores", "parent_block_scores", "changed"):
+            setattr(self, name, state.get(name))
+
+    def resize(self, population_size: int) -> None:
+        """
+        Schimbă numărul de indivizi generați începând cu generația următoare (după selecția părinților).
+        """
+        self.population_size = population_size
+        if self.changed is not None:
+            self.changed = np.zeros((population_size, self.height, self.width), dtype=bool)
+
+    def evaluate(self) -> None:
+        """
+        Evaluează toată populația și actualizează vectorul de fitness.
+        """
+        if self.score_blocks is None:
+            self.fitness = np.asarray(self.evaluate_genomes(self.genomes), dtype=np.float64)
+            return
+
+        if self.block_scores is None:
+            # Prima evaluare: toate blocurile, câte un individ odată pentru a limita memoria
+            rows, columns = np.indices((self.height, self.width))
+            rows, columns = rows.ravel(), columns.ravel()
+            self.block_scores = np.stack([self.score_blocks(rows, columns, genome.ravel()).reshape(self.height, self.width)
+                                          for genome in self.genomes])
+        else:
+            individuals, rows, columns = np.nonzero(self.changed)
+            self.block_scores[individuals, rows, columns] = self.score_blocks(rows, columns, self.genomes[individuals, rows, columns])
+
+        self.changed = np.zeros(self.genomes.shape, dtype=bool)
+        self.fitness = self.block_scores.mean(axis=(1, 2))
+
+    def local_search(self, local_search: LocalSearch) -> int:
+        """
+        Rafinează prin hill-climbing o parte din populația evaluată și actualizează fitness-ul ei.
+        Întoarce numărul de evaluări echivalente consumate.
+        """
+        count = local_search.count(len(self.fitness))
+        if local_search.selection == "elite":
+            selected = np.argsort(-self.fitness, kind="stable")[:count]
+        else:
+            selected = self.rng.choice(len(self.fitness), size=count, replace=False)
+
+        genomes, scores, evaluations = local_search.refine(self.genomes[selected], self.alphabet_size)
+        self.genomes[selected] = genomes
+        self.fitness[selected] = scores.mean(axis=(1, 2))
+        if self.block_scores is not None:
+            self.block_scores[selected] = scores
+        return evaluations
+
+    def average_fitness(self) -> float:
+        """
+        Media fitness-ului populației curente.
+        """
+        return float(self.fitness.mean()) if len(self.fitness) > 0 else 0.0
+
+    def best_chromosome(self) -> Chromosome:
+        """
+        Întoarce cel mai bun individ din populația curentă sub formă de cromozom.
+        """
+        best_index = int(self.fitness.argmax())
+        chromosome = Chromosome(genome=self.genomes[best_index])
+        chromosome.set_fitness(float(self.fitness[best_index]))
+        return chromosome
+
+    def select_parents(self) -> None:
+        """
+        Selectează părinții prin elitism și turnee, pentru toată populația deodată.
+        Fiecare turneu alege tournament_size indivizi distincți, ca random.sample.
+        """
+        elite = np.argsort(-self.fitness, kind="stable")[:self.elitism]
+
+        tournament_count = self.population_size - len(elite)
+        keys = self.rng.random((tournament_count, len(self.fitness)))
+        tournaments = np.argpartition(keys, self.tournament_size - 1, axis=1)[:, :self.tournament_size]
+        winners = tournaments[np.arange(tournament_count), self.fitness[tournaments].argmax(axis=1)]
+
+        selected = np.concatenate((elite, winners))
+        self.parents = self.genomes[selected]
+        if self.block_scores is not None:
+            self.parent_block_scores = self.block_scores[selected]
+
+    def generate_next_generation(self) -> None:
+        """
+        Generează următoarea generație prin crossover uniform între perechi aleatoare de părinți.
+        """
+        first, second = self.rng.integers(0, len(self.parents), size=(2, self.population_size))
+        mask = self.rng.random((self.population_size, self.height, self.width)) < 0.5
+        self.genomes = np.where(mask, self.parents[first], self.parents[second])
+        if self.parent_block_scores is not None:
+            self.block_scores = np.where(mask, self.parent_block_scores[first], self.parent_block_scores[second])
+
+    def mutate(self, mutation_rate: float) -> None:
+        """
+        Aplică guided mutation pe toată populația.
+        """
+        mutation_mask = mutate_genomes(self.genomes, mutation_rate, self.alphabet_size, self.rng)
+        if self.changed is not None:
+            self.changed |= mutation_mask
+
+    def introduce_new_chromosomes(self, new_chromosomes_percentage: float) -> None:
+        """
+        Înlocuiește un anumit procent de indivizi aleși aleatoriu cu genomi noi.
+        """
+        new_chromosomes_count = int(self.population_size * new_chromosomes_percentage)
+        positions = self.rng.integers(0, self.population_size, size=new_chromosomes_count)
+        self.genomes[positions] = random_genomes(self.rng, self.alphabet_size,
+                                                 (new_chromosomes_count, self.height, self.width))
+        # Ca un Chromosome nou, individul introdus nu este evaluat încă
+        self.fitness[positions] = 0.0
+        if self.changed is not None:
+            self.changed[positions] = True
+
+
+def run_genetic_algorithm(engine,
+                          generation_count: int,
+                          mutation_rate: float,
+                          base_mutation_rate: float,
+                          max_mutation_rate: float,
+                          epsilon: float,
+                          past_generation_count: int,
+                          introduce_new_chromosomes_interval: int,
+                          new_chromosomes_percentage: float,
+                          verbose: bool = True,
+                          checkpoint_writer=None,
+                          checkpoint_interval: int = 0,
+                          resume_state: Optional[dict] = None,
+                          observers: Optional[List[GenerationObserver]] = None,
+                          reporter: Optional[ProgressReporter] = None,
+                          controller: Optional[ConvergenceController] = None,
+                          local_search: Optional[LocalSearch] = None
+                          ) -> Tuple[List[float], List[float], Chromosome]:
+    """
+    Rulează algoritmul genetic pe motorul de populație dat (PopulationEngine sau orice obiect
+    cu aceleași operații, de ex. ObjectPopulationEngine din ascii_art).
+    La fiecare checkpoint_interval generații starea completă este trimisă la checkpoint_writer;
+    dacă este dat resume_state (vezi checkpoint.load_checkpoint), rularea continuă exact de unde a rămas.
+    Progresul este afișat prin reporter (vezi reporting.py); fără reporter, verbose afișează fiecare generație.
+    Observatorii (vezi instrumentation.py) primesc la fiecare generație timpii etapelor și măsurătorile populației.
+    Controlerul (vezi convergence.py) poate opri rularea mai devreme și poate adapta dimensiunea populației.
+    Cu local_search (vezi local_search.py), după fiecare evaluare o parte din populație este rafinată local.
+    Întoarce istoricul fitness-ului mediu, istoricul celui mai bun fitness și cel mai bun cromozom.
+    """
+    if resume_state is not None:
+        engine.set_state(resume_state)
+        start_generation = int(resume_state["generation"])
+        mutation_rate = resume_state["mutation_rate"]
+        average_fitness_history = list(resume_state["average_fitness_history"])
+        best_fitness_history = list(resume_state["best_fitness_history"])
+        evaluation_count = int(resume_state.get("evaluation_count", 0))
+        if controller is not None and "convergence" in resume_state:
+            controller.set_state(resume_state["convergence"])
+        logging.info(f"Rularea continua de la generatia {start_generation + 1}.")
+    else:
+        start_generation = 0
+        average_fitness_history = []
+        best_fitness_history = []
+
+        # Evaluăm populația
+        engine.evaluate()
+        average_fitness_history.append(engine.average_fitness())
+        evaluation_count = engine.population_size
+        # Selectăm părinți
+        engine.select_parents()
+
+    observers = observers or []
+    if reporter is None:
+        reporter = ProgressReporter(VERBOSITY_PREVIEW if verbose else VERBOSITY_QUIET)
+    if controller is not None:
+        controller.start()
+    last_generation = start_generation
+
+    for observer in observers:
+        observer.on_run_start()
+    # Observatorii sunt închiși (fișiere, profiler) și dacă rularea se termină cu o excepție
+    try:
+        # Generăm următoarea generație
+        for generation in range(start_generation, generation_count):
+            for observer in observers:
+                observer.on_generation_start(generation + 1)
+            phase_seconds = {}
+
+            phase_start = time.perf_counter()
+            engine.generate_next_generation()
+            phase_seconds["crossover"] = time.perf_counter() - phase_start
+            # Efectuăm mutații
+            phase_start = time.perf_counter()
+            engine.mutate(mutation_rate)
+            phase_seconds["mutation"] = time.perf_counter() - phase_start
+            phase_start = time.perf_counter()
+            engine.evaluate()
+            phase_seconds["evaluation"] = time.perf_counter() - phase_start
+            evaluation_count += engine.population_size
+            if local_search is not None:
+                phase_start = time.perf_counter()
+                evaluation_count += engine.local_search(local_search)
+                phase_seconds["local_search"] = time.perf_counter() - phase_start
+            average_fitness = engine.average_fitness()
+            average_fitness_history.append(average_fitness)
+            # Pregătim pentru următoarea iterație
+            phase_start = time.perf_counter()
+            engine.select_parents()
+            phase_seconds["selection"] = time.perf_counter() - phase_start
+
+            # Afisam imaginea ASCII generată de cel mai bun cromozom pentru fiecare generatie
+            best_chromosome = engine.best_chromosome()
+            best_fitness_history.append(best_chromosome.fitness)
+            stop_reason = controller.update(best_chromosome.fitness, evaluation_count) if controller is not None else None
+            reporter.report(generation + 1, generation_count, average_fitness, mutation_rate, best_chromosome,
+                            final=stop_reason is not None)
+
+            current_mutation_rate = mutation_rate
+            mutation_rate = adapt_mutation_rate(mutation_rate, generation, average_fitness_history, epsilon,
+                                                past_generation_count, base_mutation_rate, max_mutation_rate)
+
+            phase_start = time.perf_counter()
+            if(generation % introduce_new_chromosomes_interval == 0):
+                engine.introduce_new_chromosomes(new_chromosomes_percentage)
+            phase_seconds["immigrants"] = time.perf_counter() - phase_start
+
+            if controller is not None and stop_reason is None:
+                engine.resize(controller.population_size(engine.population_size))
+
+            if checkpoint_writer is not None and checkpoint_interval > 0 and (generation + 1) % checkpoint_interval == 0:
+                state = engine.get_state()
+                state.update(generation=generation + 1, mutation_rate=mutation_rate,
+                             average_fitness_history=list(average_fitness_history),
+                             best_fitness_history=list(best_fitness_history), evaluation_count=evaluation_count)
+                if controller is not None:
+                    state["convergence"] = controller.get_state()
+                checkpoint_writer.save(state)
+
+            if observers:
+                record = {"generation": generation + 1,
+                          "best_fitness": float(best_chromosome.fitness),
+                          "average_fitness": float(average_fitness),
+                          "mutation_rate": current_mutation_rate,
+                          "evaluations": evaluation_count,
+                          "diversity": population_entropy(engine.population_genomes(), engine.alphabet_size),
+                          "phase_seconds": phase_seconds}
+                for observer in observers:
+                    observer.on_generation_end(record)
+
+            last_generation = generation + 1
+            if stop_reason is not None:
+                break
+    finally:
+        for observer in observers:
+            observer.on_run_end()
+
+    if controller is not None:
+        controller.finish(last_generation)
+
+    return average_fitness_history, best_fitness_history, engine.best_chromosome()
@@ -0,0 +1,87 @@
+import logging
+from typing import Optional, Sequence, Tuple
+import numpy as np
+from PIL import Image
+from chromosome import random_genomes
+from fitness import compute_score_table, table_fitness
+from initialization import perturbed_copies
+from population_engine import PopulationEngine, run_genetic_algorithm
+
+
+def coarse_size(ascii_art_size: Tuple[int, int], factor: int) -> Tuple[int, int]:
+    """
+    Dimensiunea grilei ASCII micșorate de factor ori (cel puțin un bloc pe fiecare direcție).
+    """
+    ascii_width, ascii_height = ascii_art_size
+    return max(1, ascii_width // factor), max(1, ascii_height // factor)
+
+
+def downscale_image(image: Image.Image, block_size: Tuple[int, int], ascii_art_size: Tuple[int, int]) -> Image.Image:
+    """
+    Imaginea redimensionată (cu medierea pixelilor) pentru o grilă ASCII de dimensiunea dată.
+    """
+    block_width, block_height = block_size
+    ascii_width, ascii_height = ascii_art_size
+    return image.resize((ascii_width * block_width, ascii_height * block_height), Image.BOX)
+
+
+def upsample_genome(genome: np.ndarray, ascii_art_size: Tuple[int, int]) -> np.ndarray:
+    """
+    Mărește un genom (h, w) la grila (lățime, înălțime) dată, repetând fiecare caracter (nearest neighbour).
+    """
+    ascii_width, ascii_height = ascii_art_size
+    rows = np.arange(ascii_height) * genome.shape[0] // ascii_height
+    columns = np.arange(ascii_width) * genome.shape[1] // ascii_width
+    return genome[rows[:, None], columns[None, :]]
+
+
+def coarse_to_fine_genome(image: Image.Image,
+                          ascii_characters_images: dict[str, Image.Image],
+                          block_size: Tuple[int, int],
+                          ascii_art_size: Tuple[int, int],
+                          factors: Sequence[int],
+                          population_size: int,
+                          generation_count: int,
+                          tournament_size: int,
+                          elitism: int,
+                          mutation_rate: float,
+                          base_mutation_rate: float,
+                          max_mutation_rate: float,
+                          epsilon: float,
+                          past_generation_count: int,
+                          introduce_new_chromosomes_interval: int,
+                          new_chromosomes_percentage: float,
+                          perturbation_rate: float = 0.05,
+                          rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Rulează algoritmul genetic pe o piramidă de grile micșorate (factors, de la cel mai mare la cel mai mic,
+    de ex. (4, 2)). Cel mai bun genom al fiecărui nivel, mărit, pornește populația nivelului următor.
+    Întoarce genomul mărit la dimensiunea completă, folosit ca punct de pornire al rulării principale.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    alphabet_size = len(ascii_characters_images)
+    genome = None
+
+    for factor in sorted(factors, reverse=True):
+        level_size = coarse_size(ascii_art_size, factor)
+        level_image = downscale_image(image, block_size, level_size)
+        score_table = compute_score_table(level_image, ascii_characters_images, block_size, level_size)
+
+        if genome is None:
+            genomes = random_genomes(rng, alphabet_size, (population_size, level_size[1], level_size[0]))
+        else:
+            genomes = perturbed_copies(upsample_genome(genome, level_size), population_size, perturbation_rate,
+                                       alphabet_size, rng)
+
+        engine = PopulationEngine(lambda candidates: table_fitness(score_table, candidates),
+                                  population_size, alphabet_size, level_size, tournament_size, elitism,
+                                  rng=rng, genomes=genomes)
+        run_genetic_algorithm(engine, generation_count, mutation_rate, base_mutation_rate, max_mutation_rate,
+                              epsilon, past_generation_count, introduce_new_chromosomes_interval,
+                              new_chromosomes_percentage, verbose=False)
+
+        best_index = int(engine.fitness.argmax())
+        genome = engine.genomes[best_index].copy()
+        logging.info(f"Nivelul 1/{factor} ({level_size[0]}x{level_size[1]}): fitness {engine.fitness[best_index]:.4f}")
+
+    return upsample_genome(genome, ascii_art_size)
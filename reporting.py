@@ -0,0 +1,111 @@
+import logging
+import os
+import sys
+import time
+from typing import IO, Optional, Sequence
+
+# Nivelurile de detaliu ale afișării din timpul rulării
+VERBOSITY_QUIET = 0  # nimic în afară de mesajele de logging
+VERBOSITY_PROGRESS = 1  # o linie de progres (generația, fitness-ul) la fiecare raport
+VERBOSITY_PREVIEW = 2  # linia de progres plus imaginea ASCII a celui mai bun cromozom
+
+
+class ProgressReporter:
+    """
+    Afișarea progresului buclei genetice. Un raport este scris cel mult o dată la every_generations
+    generații și cel mult o dată la every_seconds secunde (ultima generație este raportată mereu),
+    ca un singur șir, astfel încât scrierea în terminal să nu domine timpul de rulare.
+    """
+
+    def __init__(self,
+                 verbosity: int = VERBOSITY_PREVIEW,
+                 every_generations: int = 1,
+                 every_seconds: float = 0.0,
+                 stream: Optional[IO[str]] = None) -> None:
+        self.verbosity = verbosity
+        self.every_generations = max(1, every_generations)
+        self.every_seconds = every_seconds
+        self.stream = stream
+        self._last_report_time: Optional[float] = None
+
+    def _should_report(self, generation: int, generation_count: int, final: bool) -> bool:
+        """
+        Dacă generația curentă (numerotată de la 1) trebuie raportată.
+        """
+        if self.verbosity <= VERBOSITY_QUIET:
+            return False
+        if final or generation == generation_count:
+            return True
+        if generation % self.every_generations != 0:
+            return False
+        return self._last_report_time is None or time.monotonic() - self._last_report_time >= self.every_seconds
+
+    def report(self, generation: int, generation_count: int, average_fitness: float, mutation_rate: float,
+               best_chromosome, final: bool = False) -> None:
+        """
+        Raportează generația dată, dacă limitele de frecvență o permit.
+        final marchează ultima generație a unei rulări oprite mai devreme, care este raportată mereu.
+        """
+        if not self._should_report(generation, generation_count, final):
+            return
+        self._last_report_time = time.monotonic()
+
+        parts = [f"Generatia {generation}/{generation_count}: fitness mediu {average_fitness:.4f}, "
+                 f"cel mai bun {best_chromosome.fitness:.4f}, rata de mutatie {mutation_rate:.4f}\n"]
+        if self.verbosity >= VERBOSITY_PREVIEW:
+            parts.append("Imaginea ASCII generata de cel mai bun cromozom:\n")
+            parts.append(best_chromosome.to_text() + "\n")
+
+        stream = self.stream or sys.stdout
+        stream.write("".join(parts))
+        stream.flush()
+
+
+def is_headless() -> bool:
+    """
+    Dacă nu există un ecran pentru ferestre interactive (de ex. pe un server, prin SSH sau în CI).
+    """
+    if sys.platform.startswith("linux"):
+        return not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    return False
+
+
+def save_results(ascii_text: str,
+                 average_fitness_history: Sequence[float],
+                 best_fitness_history: Sequence[float],
+                 output_directory: str = "output",
+                 headless: Optional[bool] = None) -> None:
+    """
+    Salvează imaginea ASCII în best_ascii_art.txt și graficul evoluției fitness-ului în fitness_evolution.png.
+    În modul headless (implicit detectat automat) graficul este desenat cu backend-ul Agg, fără fereastră
+    și fără a aștepta după plt.show(); altfel este și afișat.
+    """
+    if headless is None:
+        headless = is_headless()
+
+    os.makedirs(output_directory, exist_ok=True)
+    with open(os.path.join(output_directory, "best_ascii_art.txt"), "w", encoding="utf-8") as f:
+        f.write(ascii_text + "\n")
+
+    # matplotlib este importat doar aici, ca backend-ul să poată fi ales înainte de pyplot
+    import matplotlib
+    if headless:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figure, axes = plt.subplots()
+    if len(average_fitness_history):
+        axes.plot(average_fitness_history, label="Fitness mediu")
+    axes.plot(best_fitness_history, label="Fitness cel mai bun")
+    axes.set_xlabel("Generatia")
+    axes.set_ylabel("Fitness")
+    axes.set_title("Evolutia fitness-ului")
+    axes.legend()
+    figure_path = os.path.join(output_directory, "fitness_evolution.png")
+    figure.savefig(figure_path)
+    logging.info(f"Rezultatele au fost salvate in '{output_directory}'.")
+
+    if headless:
+        plt.close(figure)
+    else:
+        plt.show()
@@ -0,0 +1,290 @@
+import argparse
+import io
+import json
+import logging
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qsl, urlsplit
+from generator import AsciiArtGenerator, GeneratorConfig
+
+# Generatorul fiecărui proces worker, cu atlasul deja încărcat
+_worker_generator: Optional[AsciiArtGenerator] = None
+
+
+def _initialize_worker(config: GeneratorConfig) -> None:
+    """
+    Creează generatorul workerului și încarcă atlasul o singură dată, la pornirea procesului.
+    """
+    global _worker_generator
+    _worker_generator = AsciiArtGenerator(config)
+    _worker_generator.warm_up()
+
+
+def _ping() -> int:
+    """
+    Sarcină goală, folosită pentru a porni toți workerii înainte de primele cereri.
+    """
+    return os.getpid()
+
+
+def _generate_in_worker(image_bytes: bytes, overrides: dict) -> dict:
+    """
+    Rulează o conversie în worker și întoarce rezultatul ca dicționar serializabil.
+    """
+    result = _worker_generator.generate(io.BytesIO(image_bytes), **overrides)
+    return {"text": result.text, "fitness": result.fitness, "maximum_fitness": result.maximum_fitness,
+            "generation_count": result.generation_count, "stop_reason": result.stop_reason}
+
+
+# Bugetul de timp al buclei genetice pentru o cerere: valoarea implicită a serverului și maximul pe care
+# o cerere nu îl poate depăși. Bugetul este verificat după fiecare generație, deci o conversie îl poate
+# depăși cu cel mult o generație (plus evaluarea inițială și nivelurile piramidei, pe grile micșorate).
+DEFAULT_TIME_BUDGET_SECONDS = 60.0
+MAX_TIME_BUDGET_SECONDS = 600.0
+
+# Parametrii pe care o cerere îi poate schimba și valorile permise: ("int" | "float", minim, maxim),
+# sau tuplul valorilor acceptate. Fontul, setul de caractere, dimensiunea blocurilor și dimensiunea maximă
+# a imaginii sunt fixate la pornirea serverului. Durata unei cereri este mărginită de time_budget_seconds,
+# care nu poate fi dezactivat; celelalte limite doar resping valorile absurde.
+REQUEST_PARAMETERS = {
+    "fitness_mode": ("l1", "ssim", "l1+ssim"),
+    "ssim_weight": ("float", 0.0, 1.0),
+    "coherence_weight": ("float", 0.0, 10.0),
+    "repetition_weight": ("float", 0.0, 10.0),
+    "solver": ("auto", "exact", "ga"),
+    "initialization_strategy": ("random", "greedy", "luminance", "pyramid"),
+    "seeded_fraction": ("float", 0.0, 1.0),
+    "seed_perturbation_rate": ("float", 0.0, 1.0),
+    "pyramid_generation_count": ("int", 0, 1000),
+    "local_search_fraction": ("float", 0.0, 1.0),
+    "local_search_selection": ("elite", "random"),
+    "local_search_steps": ("int", 1, 20),
+    "target_fitness_fraction": ("float", 0.0, 1.0),
+    "stagnation_generations": ("int", 1, 2000),
+    "time_budget_seconds": ("float", 0.0, MAX_TIME_BUDGET_SECONDS),
+    "evaluation_budget": ("int", 1, 10_000_000),
+    "population_size": ("int", 2, 1000),
+    "tournament_size": ("int", 1, 1000),
+    "generation_count": ("int", 0, 2000),
+    "mutation_rate": ("float", 0.0, 1.0),
+    "base_mutation_rate": ("float", 0.0, 1.0),
+    "max_mutation_rate": ("float", 0.0, 1.0),
+    "elitism": ("int", 0, 1000),
+    "epsilon": ("float", 0.0, 1.0),
+    "past_generation_count": ("int", 1, 2000),
+    "introduce_new_chromosomes_interval": ("int", 1, 2000),
+    "new_chromosomes_percentage": ("float", 0.0, 1.0),
+    "seed": ("int", 0, 2**63 - 1),
+}
+
+# Parametrii care pot fi None (condiție dezactivată, respectiv seed aleator)
+OPTIONAL_PARAMETERS = {"target_fitness_fraction", "stagnation_generations", "evaluation_budget", "seed"}
+
+
+def validate_overrides(overrides: dict, config: GeneratorConfig) -> dict:
+    """
+    Verifică numele, tipurile și intervalele parametrilor unei cereri (vezi REQUEST_PARAMETERS).
+    Aruncă ValueError cu un mesaj pentru client dacă un parametru nu este permis.
+    """
+    for name, value in overrides.items():
+        if name not in REQUEST_PARAMETERS:
+            raise ValueError(f"Parametrul '{name}' nu poate fi schimbat.")
+        if value is None and name in OPTIONAL_PARAMETERS:
+            continue
+
+        rule = REQUEST_PARAMETERS[name]
+        if rule[0] in ("int", "float"):
+            kind, minimum, maximum = rule
+            valid_types = (int,) if kind == "int" else (int, float)
+            if isinstance(value, bool) or not isinstance(value, valid_types):
+                raise ValueError(f"Parametrul '{name}' trebuie sa fie de tip {kind}.")
+            if not minimum <= value <= maximum:
+                raise ValueError(f"Parametrul '{name}' trebuie sa fie intre {minimum} si {maximum}.")
+        elif value not in rule:
+            raise ValueError(f"Parametrul '{name}' trebuie sa fie unul dintre: {', '.join(rule)}.")
+
+    merged = config.replace(**overrides)
+    if merged.tournament_size > merged.population_size or merged.elitism > merged.population_size:
+        raise ValueError("tournament_size si elitism nu pot depasi population_size.")
+    return overrides
+
+
+def parse_overrides(query: str) -> dict:
+    """
+    Parametrii unei cereri din query string (de ex. generation_count=100&fitness_mode="ssim").
+    Valorile sunt citite ca JSON, iar cele care nu sunt JSON valid rămân șiruri.
+    """
+    overrides = {}
+    for name, value in parse_qsl(query):
+        try:
+            overrides[name] = json.loads(value)
+        except json.JSONDecodeError:
+            overrides[name] = value
+    return overrides
+
+
+class AsciiArtServer:
+    """
+    Serviciu HTTP local care păstrează între cereri un grup de procese cu atlasele încărcate.
+    Conversiile așteaptă într-o coadă până când un worker este liber; peste max_pending cereri
+    în așteptare, cererile noi sunt refuzate (503) în loc să crească coada la nesfârșit.
+    Fiecare conversie are bugetul de timp time_budget_seconds (cel mult MAX_TIME_BUDGET_SECONDS),
+    pe care o cerere îl poate micșora, dar nu îl poate dezactiva.
+
+    POST /convert cu imaginea în corpul cererii; parametrii din REQUEST_PARAMETERS pot fi schimbați din
+    query string (ceilalți rămân cei de la pornire), iar format=json întoarce și fitness-ul și motivul opririi. GET /health verifică serviciul.
+    """
+
+    def __init__(self,
+                 config: Optional[GeneratorConfig] = None,
+                 host: str = "127.0.0.1",
+                 port: int = 8000,
+                 worker_count: Optional[int] = None,
+                 max_pending: int = 64,
+                 max_body_bytes: int = 20 * 2**20,
+                 time_budget_seconds: float = DEFAULT_TIME_BUDGET_SECONDS) -> None:
+        config = config if config is not None else GeneratorConfig()
+        self.config = config.replace(time_budget_seconds=min(time_budget_seconds, MAX_TIME_BUDGET_SECONDS))
+        self.worker_count = worker_count or os.cpu_count() or 1
+        self.max_body_bytes = max_body_bytes
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+        # Workerii pornesc (și își încarcă atlasul) înainte de a accepta cereri
+        self._executor = ProcessPoolExecutor(max_workers=self.worker_count, initializer=_initialize_worker,
+                                             initargs=(self.config,))
+        for future in [self._executor.submit(_ping) for _ in range(self.worker_count)]:
+            future.result()
+
+        self._http_server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._http_server.daemon_threads = True
+        logging.info(f"Serverul asculta pe http://{host}:{self._http_server.server_port} cu {self.worker_count} workeri.")
+
+    @property
+    def address(self) -> tuple:
+        """
+        Adresa (host, port) pe care ascultă serverul.
+        """
+        return self._http_server.server_address
+
+    def submit(self, image_bytes: bytes, overrides: dict) -> Optional[Future]:
+        """
+        Pune o conversie în coadă; întoarce None dacă sunt deja max_pending conversii în așteptare.
+        """
+        if not self._slots.acquire(blocking=False):
+            return None
+        future = self._executor.submit(_generate_in_worker, image_bytes, overrides)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def serve_forever(self) -> None:
+        """
+        Servește cereri până la shutdown() sau KeyboardInterrupt, apoi oprește procesele worker.
+        """
+        try:
+            self._http_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._http_server.server_close()
+            self._executor.shutdown(cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """
+        Oprește serve_forever; trebuie apelată din alt fir de execuție.
+        """
+        self._http_server.shutdown()
+
+    def _handler_class(self) -> type:
+        """
+        Clasa care tratează cererile HTTP pentru acest server.
+        """
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self, status: int, body: str, content_type: str = "text/plain; charset=utf-8") -> None:
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                if urlsplit(self.path).path == "/health":
+                    self._respond(200, "ok\n")
+                else:
+                    self._respond(404, "Ruta necunoscuta.\n")
+
+            def do_POST(self) -> None:
+                url = urlsplit(self.path)
+                if url.path != "/convert":
+                    self._respond(404, "Ruta necunoscuta.\n")
+                    return
+
+                overrides = parse_overrides(url.query)
+                response_format = overrides.pop("format", "text")
+                if response_format not in ("text", "json"):
+                    self._respond(400, "Parametrul 'format' trebuie sa fie 'text' sau 'json'.\n")
+                    return
+                try:
+                    validate_overrides(overrides, server.config)
+                except ValueError as e:
+                    self._respond(400, f"Parametri invalizi: {e}\n")
+                    return
+
+                try:
+                    content_length = int(self.headers.get("Content-Length", 0))
+                except ValueError:
+                    self._respond(400, "Content-Length invalid.\n")
+                    return
+                if not 0 < content_length <= server.max_body_bytes:
+                    self._respond(413, f"Imaginea trebuie sa aiba intre 1 si {server.max_body_bytes} octeti.\n")
+                    return
+                image_bytes = self.rfile.read(content_length)
+                future = server.submit(image_bytes, overrides)
+                if future is None:
+                    self._respond(503, "Prea multe conversii in asteptare.\n")
+                    return
+                try:
+                    result = future.result()
+                except ValueError as e:
+                    self._respond(400, f"{e}\n")
+                    return
+                except Exception as e:
+                    logging.error(f"Conversia a esuat: {e}")
+                    self._respond(500, "Conversia a esuat.\n")
+                    return
+
+                if response_format == "json":
+                    self._respond(200, json.dumps(result), "application/json")
+                else:
+                    self._respond(200, result["text"] + "\n")
+
+            def log_message(self, format: str, *args) -> None:
+                logging.info(f"{self.address_string()} {format % args}")
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serviciu HTTP local pentru conversia imaginilor in ASCII art.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None, help="Numarul de procese (implicit toate procesoarele)")
+    parser.add_argument("--max-pending", type=int, default=64, help="Conversii in asteptare peste care cererile sunt refuzate")
+    parser.add_argument("--characters", default=os.path.join("input", "characters.txt"))
+    parser.add_argument("--font", default="DejaVuSansMono.ttf")
+    parser.add_argument("--block-size", type=int, nargs=2, default=(8, 16), metavar=("LATIME", "INALTIME"))
+    parser.add_argument("--max-image-size", type=int, nargs=2, default=(2000, 2000), metavar=("LATIME", "INALTIME"),
+                        help="Imaginile mai mari sunt micsorate sa incapa in aceasta dimensiune")
+    parser.add_argument("--time-budget", type=float, default=DEFAULT_TIME_BUDGET_SECONDS,
+                        help=f"Secunde pentru algoritmul genetic al unei conversii (cel mult {MAX_TIME_BUDGET_SECONDS:.0f})")
+    arguments = parser.parse_args()
+
+    config = GeneratorConfig(block_size=tuple(arguments.block_size), font=arguments.font,
+                             characters_path=arguments.characters, max_image_size=tuple(arguments.max_image_size))
+    AsciiArtServer(config, arguments.host, arguments.port, arguments.workers, arguments.max_pending,
+                   time_budget_seconds=arguments.time_budget).serve_forever()
@@ -0,0 +1,107 @@
+from typing import Tuple
+import numpy as np
+
+
+def compose_canvas(glyphs: np.ndarray, genomes: np.ndarray) -> np.ndarray:
+    """
+    Compune imaginile ASCII ale genomilor (N, H, W) prin indexare în imaginile caracterelor
+    (G, block_height, block_width). Rezultatul are forma (N, H * block_height, W * block_width).
+    """
+    count, ascii_height, ascii_width = genomes.shape
+    _, block_height, block_width = glyphs.shape
+    return glyphs[genomes].transpose(0, 1, 3, 2, 4).reshape(count, ascii_height * block_height, ascii_width * block_width)
+
+
+def window_sums(arrays: np.ndarray, win_size: int) -> np.ndarray:
+    """
+    Suma valorilor din fiecare fereastră win_size x win_size complet interioară, calculată cu imagini integrale.
+    arrays are forma (..., height, width); rezultatul (..., height - win_size + 1, width - win_size + 1).
+    """
+    integral = np.zeros(arrays.shape[:-2] + (arrays.shape[-2] + 1, arrays.shape[-1] + 1), dtype=np.float64)
+    np.cumsum(np.cumsum(arrays, axis=-2, dtype=np.float64), axis=-1, out=integral[..., 1:, 1:])
+    return (integral[..., win_size:, win_size:] - integral[..., :-win_size, win_size:]
+            - integral[..., win_size:, :-win_size] + integral[..., :-win_size, :-win_size])
+
+
+class SSIMEvaluator:
+    """
+    Fitness SSIM calculat pe toată imaginea ASCII randată, pentru mai mulți genomi deodată.
+    Rezultatul este identic cu skimage.metrics.structural_similarity (fereastră uniformă,
+    covarianță de eșantion). Mediile și varianțele locale ale imaginii originale se calculează
+    o singură dată; pentru imaginile candidate se folosesc imagini integrale.
+    """
+
+    def __init__(self,
+                 image_array: np.ndarray,
+                 glyphs: np.ndarray,
+                 ascii_art_size: Tuple[int, int],
+                 win_size: int = 7,
+                 data_range: float = 255.0,
+                 K1: float = 0.01,
+                 K2: float = 0.03,
+                 batch_size: int = 16) -> None:
+        """
+        image_array este imaginea preprocesată (grayscale), iar glyphs imaginile caracterelor (G, block_height, block_width).
+        """
+        _, block_height, block_width = glyphs.shape
+        ascii_width, ascii_height = ascii_art_size
+        self.image = image_array[:ascii_height * block_height, :ascii_width * block_width].astype(np.float64)
+        self.glyphs = glyphs
+        self.block_size = (block_width, block_height)
+        self.win_size = win_size
+        self.C1 = (K1 * data_range) ** 2
+        self.C2 = (K2 * data_range) ** 2
+        self.batch_size = batch_size
+        self.image_statistics = self._image_statistics(self.image)
+
+    def _image_statistics(self, image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Media și varianța locală a imaginii originale pe fiecare fereastră.
+        """
+        pixel_count = self.win_size ** 2
+        mean = window_sums(image, self.win_size) / pixel_count
+        variance = window_sums(image * image, self.win_size) / pixel_count - mean * mean
+        return mean, variance * pixel_count / (pixel_count - 1)
+
+    def _ssim(self, image: np.ndarray, statistics: Tuple[np.ndarray, np.ndarray], genomes: np.ndarray) -> np.ndarray:
+        """
+        SSIM mediu între image și imaginile randate ale genomilor, pe loturi de batch_size genomi.
+        """
+        image_mean, image_variance = statistics
+        pixel_count = self.win_size ** 2
+        covariance_norm = pixel_count / (pixel_count - 1)
+
+        results = []
+        for start in range(0, len(genomes), self.batch_size):
+            canvas = compose_canvas(self.glyphs, genomes[start:start + self.batch_size]).astype(np.float64)
+            canvas_mean = window_sums(canvas, self.win_size) / pixel_count
+            canvas_variance = covariance_norm * (window_sums(canvas * canvas, self.win_size) / pixel_count - canvas_mean * canvas_mean)
+            covariance = covariance_norm * (window_sums(canvas * image, self.win_size) / pixel_count - canvas_mean * image_mean)
+
+            numerator = (2 * canvas_mean * image_mean + self.C1) * (2 * covariance + self.C2)
+            denominator = (canvas_mean * canvas_mean + image_mean * image_mean + self.C1) * (canvas_variance + image_variance + self.C2)
+            results.append((numerator / denominator).mean(axis=(1, 2)))
+
+        return np.concatenate(results)
+
+    def __call__(self, genomes: np.ndarray) -> np.ndarray:
+        """
+        SSIM-ul fiecărui genom (N, H, W) față de toată imaginea.
+        """
+        return self._ssim(self.image, self.image_statistics, genomes)
+
+    def evaluate_region(self, genomes: np.ndarray, region: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        SSIM-ul genomilor (N, h, w) care acoperă doar regiunea (left, top, right, bottom), în blocuri.
+        """
+        left, top, right, bottom = region
+        block_width, block_height = self.block_size
+        image = self.image[top * block_height:bottom * block_height, left * block_width:right * block_width]
+        return self._ssim(image, self._image_statistics(image), genomes)
+
+
+def combined_fitness(l1_fitness: np.ndarray, ssim_fitness: np.ndarray, ssim_weight: float) -> np.ndarray:
+    """
+    Combinația liniară dintre fitness-ul L1 și SSIM.
+    """
+    return (1.0 - ssim_weight) * l1_fitness + ssim_weight * ssim_fitness
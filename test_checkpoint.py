@@ -0,0 +1,55 @@
+"""
+O rulare reluată din checkpoint trebuie să fie identică cu rularea neîntreruptă, iar un checkpoint
+salvat pentru altă rulare trebuie refuzat.
+"""
+import random
+import numpy as np
+import pytest
+from ascii_art import ObjectPopulationEngine, evaluate_individuals, generate_population
+from checkpoint import CheckpointWriter, checkpoint_key, load_checkpoint
+from chromosome import Chromosome
+from fitness import table_fitness
+from population_engine import PopulationEngine, run_genetic_algorithm
+
+
+@pytest.mark.parametrize("engine_type", ["tensor", "object"])
+def test_resumed_run_equals_uninterrupted_run(problem, ga_parameters, tmp_path, engine_type):
+    score_table = problem.score_table
+    checkpoint_path = str(tmp_path / "checkpoint.npz")
+    key = checkpoint_key(score_table, problem.characters, problem.block_size, engine_type=engine_type)
+
+    def create_engine(seed: int):
+        if engine_type == "tensor":
+            return PopulationEngine(lambda genomes: table_fitness(score_table, genomes), 20, len(problem.characters),
+                                    problem.ascii_art_size, 3, 2, rng=np.random.default_rng(seed))
+        Chromosome.set_seed(seed)
+        random.seed(seed)
+        return ObjectPopulationEngine(lambda population: evaluate_individuals(
+            population, None, {}, problem.block_size, problem.ascii_art_size, score_table=score_table), 20, 3, 2,
+            generate_population(20))
+
+    # Rularea completă salvează un checkpoint la generația 10, din care continuă a doua rulare
+    writer = CheckpointWriter(checkpoint_path, key)
+    try:
+        expected = run_genetic_algorithm(create_engine(5), 14, checkpoint_writer=writer, checkpoint_interval=10,
+                                         **ga_parameters)
+    finally:
+        writer.close()
+    resumed = run_genetic_algorithm(create_engine(99), 14, resume_state=load_checkpoint(checkpoint_path, key),
+                                    **ga_parameters)
+
+    assert resumed[0] == expected[0]
+    assert resumed[1] == expected[1]
+    np.testing.assert_array_equal(resumed[2].genome, expected[2].genome)
+
+
+def test_checkpoint_for_another_run_is_rejected(problem, tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.npz")
+    writer = CheckpointWriter(checkpoint_path, checkpoint_key(problem.score_table, problem.characters,
+                                                              problem.block_size))
+    writer.save({"generation": 1})
+    writer.close()
+
+    with pytest.raises(ValueError, match="alphabet_size"):
+        load_checkpoint(checkpoint_path, checkpoint_key(problem.score_table[:, :, :5], problem.characters[:5],
+                                                        problem.block_size))
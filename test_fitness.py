@@ -0,0 +1,29 @@
+"""
+Tabelul de scoruri (bloc, caracter) trebuie să dea exact fitness-ul calculat din pixeli,
+iar soluția exactă (argmax pe fiecare bloc) trebuie să fie optimul fitness-ului L1.
+"""
+import numpy as np
+import pytest
+from ascii_art import finess_function
+from fitness import best_genome, table_fitness
+
+
+def test_score_table_matches_pixel_fitness(problem):
+    genome = np.random.default_rng(1).integers(0, len(problem.characters), problem.score_table.shape[:2])
+    ascii_image = [[problem.characters[index] for index in row] for row in genome]
+
+    expected = finess_function(problem.image, ascii_image, problem.ascii_characters_images, problem.block_size,
+                               problem.ascii_art_size)
+    assert table_fitness(problem.score_table, genome) == pytest.approx(expected, abs=1e-12)
+
+
+def test_best_genome_is_the_optimum(problem):
+    score_table = problem.score_table
+    genome = best_genome(score_table)
+
+    assert table_fitness(score_table, genome) == pytest.approx(score_table.max(axis=2).mean(), abs=1e-12)
+    # Nicio schimbare a unui singur bloc și niciun genom aleator nu îl depășesc
+    for y, x, index in np.ndindex(score_table.shape):
+        assert score_table[y, x, index] <= score_table[y, x, genome[y, x]]
+    candidates = np.random.default_rng(3).integers(0, len(problem.characters), (200,) + score_table.shape[:2])
+    assert table_fitness(score_table, candidates).max() <= table_fitness(score_table, genome)
@@ -0,0 +1,27 @@
+"""
+Evaluarea incrementală (doar blocurile modificate prin crossover și mutație) trebuie să dea același
+fitness ca evaluarea completă, pentru ambele motoare de populație.
+"""
+from functools import partial
+import numpy as np
+from ascii_art import ObjectPopulationEngine, evaluate_individuals_incremental
+from fitness import image_to_blocks, pixel_scores_at, stack_character_images, table_fitness
+from population_engine import PopulationEngine, run_genetic_algorithm
+
+
+def test_incremental_evaluation_equals_full_evaluation(problem, ga_parameters):
+    score_blocks = partial(pixel_scores_at,
+                           image_to_blocks(np.array(problem.image), problem.block_size, problem.ascii_art_size),
+                           stack_character_images(problem.ascii_characters_images))
+
+    engine = PopulationEngine(None, 20, len(problem.characters), problem.ascii_art_size, 3, 2,
+                              rng=np.random.default_rng(2), score_blocks=score_blocks)
+    run_genetic_algorithm(engine, 10, **ga_parameters)
+    np.testing.assert_allclose(engine.fitness, table_fitness(problem.score_table, engine.genomes), rtol=0, atol=1e-12)
+
+    engine = ObjectPopulationEngine(lambda population: evaluate_individuals_incremental(population, score_blocks),
+                                    20, 3, 2)
+    run_genetic_algorithm(engine, 10, **ga_parameters)
+    fitness = np.array([chromosome.fitness for chromosome in engine.population])
+    np.testing.assert_allclose(fitness, table_fitness(problem.score_table, engine.population_genomes()),
+                               rtol=0, atol=1e-12)
@@ -0,0 +1,21 @@
+"""
+SSIM-ul vectorizat trebuie să fie identic cu skimage.metrics.structural_similarity.
+"""
+import numpy as np
+import pytest
+from fitness import stack_character_images
+from ssim_fitness import SSIMEvaluator
+
+
+def test_ssim_matches_skimage(problem):
+    structural_similarity = pytest.importorskip("skimage.metrics").structural_similarity
+    image = np.array(problem.image)
+    glyphs = stack_character_images(problem.ascii_characters_images)
+    ascii_width, ascii_height = problem.ascii_art_size
+    genomes = np.random.default_rng(4).integers(0, len(problem.characters), (5, ascii_height, ascii_width))
+
+    evaluator = SSIMEvaluator(image, glyphs, problem.ascii_art_size)
+    expected = [structural_similarity(np.vstack([np.hstack([glyphs[index] for index in row]) for row in genome]),
+                                      image, data_range=255, win_size=7)
+                for genome in genomes]
+    np.testing.assert_allclose(evaluator(genomes), expected, rtol=0, atol=1e-10)
@@ -0,0 +1,176 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+from fitness import table_fitness
+from population_engine import PopulationEngine, run_genetic_algorithm
+
+# O regiune a grilei ASCII, în coordonate de bloc: (left, top, right, bottom)
+Region = Tuple[int, int, int, int]
+
+
+def split_into_tiles(ascii_art_size: Tuple[int, int], tile_size: Tuple[int, int]) -> List[Region]:
+    """
+    Împarte grila ASCII în tile-uri de cel mult tile_size (lățime, înălțime) blocuri.
+    """
+    ascii_width, ascii_height = ascii_art_size
+    tile_width, tile_height = tile_size
+    return [(left, top, min(left + tile_width, ascii_width), min(top + tile_height, ascii_height))
+            for top in range(0, ascii_height, tile_height)
+            for left in range(0, ascii_width, tile_width)]
+
+
+def _evolve_tile(tile_score_table: np.ndarray,
+                 population_size: int,
+                 generation_count: int,
+                 tournament_size: int,
+                 elitism: int,
+                 mutation_rate: float,
+                 base_mutation_rate: float,
+                 max_mutation_rate: float,
+                 epsilon: float,
+                 past_generation_count: int,
+                 introduce_new_chromosomes_interval: int,
+                 new_chromosomes_percentage: float,
+                 seed: np.random.SeedSequence) -> Tuple[np.ndarray, List[float]]:
+    """
+    Evoluează o populație proprie pentru un singur tile, folosind doar partea lui din tabelul de scoruri.
+    Întoarce cel mai bun genom al tile-ului și istoricul celui mai bun fitness.
+    """
+    tile_height, tile_width, alphabet_size = tile_score_table.shape
+    engine = PopulationEngine(lambda genomes: table_fitness(tile_score_table, genomes),
+                              population_size, alphabet_size, (tile_width, tile_height),
+                              tournament_size, elitism, rng=np.random.default_rng(seed))
+    _, best_fitness_history, _ = run_genetic_algorithm(
+        engine, generation_count, mutation_rate, base_mutation_rate, max_mutation_rate, epsilon,
+        past_generation_count, introduce_new_chromosomes_interval, new_chromosomes_percentage, verbose=False)
+
+    return engine.genomes[int(engine.fitness.argmax())].copy(), best_fitness_history
+
+
+def seam_regions(ascii_art_size: Tuple[int, int], tiles: List[Region], seam_width: int) -> List[Region]:
+    """
+    Benzile de lățime 2 * seam_width blocuri centrate pe granițele interioare dintre tile-uri.
+    """
+    ascii_width, ascii_height = ascii_art_size
+    vertical_seams = sorted({left for left, _, _, _ in tiles if left > 0})
+    horizontal_seams = sorted({top for _, top, _, _ in tiles if top > 0})
+
+    regions = [(max(0, x - seam_width), 0, min(ascii_width, x + seam_width), ascii_height) for x in vertical_seams]
+    regions += [(0, max(0, y - seam_width), ascii_width, min(ascii_height, y + seam_width)) for y in horizontal_seams]
+    return regions
+
+
+def refine_seams(genome: np.ndarray,
+                 seams: List[Region],
+                 seam_fitness: Callable[[np.ndarray, Region], np.ndarray],
+                 alphabet_size: int,
+                 population_size: int,
+                 generation_count: int,
+                 tournament_size: int,
+                 elitism: int,
+                 mutation_rate: float,
+                 context: int = 2,
+                 rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Pas de rafinare a granițelor pentru metrici structurale (ex. SSIM), care nu se descompun pe blocuri.
+    Pentru fiecare bandă se evoluează doar genele din bandă, pornind de la rezultatul lipit, iar
+    evaluarea se face pe bandă plus context blocuri vecine de fiecare parte.
+    seam_fitness(genomes, region) primește genomi (N, h, w) pentru regiunea dată și întoarce fitness-ul lor.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    ascii_height, ascii_width = genome.shape
+    genome = genome.copy()
+
+    for left, top, right, bottom in seams:
+        window = (max(0, left - context), max(0, top - context),
+                  min(ascii_width, right + context), min(ascii_height, bottom + context))
+        window_genome = genome[window[1]:window[3], window[0]:window[2]]
+        band = (slice(top - window[1], bottom - window[1]), slice(left - window[0], right - window[0]))
+
+        def evaluate_band(band_genomes: np.ndarray) -> np.ndarray:
+            window_genomes = np.repeat(window_genome[None], len(band_genomes), axis=0)
+            window_genomes[(slice(None),) + band] = band_genomes
+            return seam_fitness(window_genomes, window)
+
+        # Populația pornește din banda actuală, cu mutații pentru diversitate
+        initial = np.repeat(genome[top:bottom, left:right][None], population_size, axis=0)
+        engine = PopulationEngine(evaluate_band, population_size, alphabet_size, (right - left, bottom - top),
+                                  tournament_size, elitism, rng=rng, genomes=initial)
+        engine.mutate(mutation_rate)
+        engine.genomes[0] = genome[top:bottom, left:right]
+
+        engine.evaluate()
+        engine.select_parents()
+        for _ in range(generation_count):
+            engine.generate_next_generation()
+            engine.mutate(mutation_rate)
+            engine.evaluate()
+            engine.select_parents()
+
+        # Păstrăm banda evoluată doar dacă îmbunătățește fereastra
+        current_fitness = evaluate_band(genome[top:bottom, left:right][None])[0]
+        best_index = int(engine.fitness.argmax())
+        if engine.fitness[best_index] > current_fitness:
+            genome[top:bottom, left:right] = engine.genomes[best_index]
+            logging.debug(f"Granita {(left, top, right, bottom)}: {current_fitness:.4f} -> {engine.fitness[best_index]:.4f}")
+
+    return genome
+
+
+def run_tiled_ga(score_table: np.ndarray,
+                 tile_size: Tuple[int, int],
+                 population_size: int,
+                 generation_count: int,
+                 tournament_size: int = 5,
+                 elitism: int = 3,
+                 mutation_rate: float = 0.1,
+                 base_mutation_rate: float = 0.06,
+                 max_mutation_rate: float = 0.2,
+                 epsilon: float = 0.0001,
+                 past_generation_count: int = 10,
+                 introduce_new_chromosomes_interval: int = 25,
+                 new_chromosomes_percentage: float = 0.25,
+                 worker_count: Optional[int] = 1,
+                 seed: Optional[int] = None,
+                 seam_fitness: Optional[Callable[[np.ndarray, Region], np.ndarray]] = None,
+                 seam_width: int = 2,
+                 seam_generation_count: int = 50
+                 ) -> Tuple[np.ndarray, float, List[float]]:
+    """
+    Algoritmul genetic pe tile-uri: grila ASCII este împărțită în tile-uri de tile_size blocuri,
+    fiecare tile evoluează cu propria populație (în paralel dacă worker_count != 1, None = toate
+    procesoarele), iar rezultatele sunt lipite într-un singur genom.
+    Dacă este dată o metrică structurală (seam_fitness), granițele dintre tile-uri sunt rafinate la final.
+    Întoarce genomul final, fitness-ul lui L1 și istoricul celui mai bun fitness al imaginii lipite
+    (media tile-urilor ponderată cu numărul de blocuri).
+    """
+    ascii_height, ascii_width, alphabet_size = score_table.shape
+    tiles = split_into_tiles((ascii_width, ascii_height), tile_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(tiles) + 1)
+    arguments = [(score_table[top:bottom, left:right], population_size, generation_count, tournament_size,
+                  elitism, mutation_rate, base_mutation_rate, max_mutation_rate, epsilon, past_generation_count,
+                  introduce_new_chromosomes_interval, new_chromosomes_percentage, seeds[index])
+                 for index, (left, top, right, bottom) in enumerate(tiles)]
+    logging.info(f"Se evolueaza {len(tiles)} tile-uri de cel mult {tile_size[0]}x{tile_size[1]} blocuri...")
+
+    if worker_count == 1:
+        tile_results = [_evolve_tile(*tile_arguments) for tile_arguments in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            tile_results = list(executor.map(_evolve_tile, *zip(*arguments)))
+
+    # Lipim tile-urile într-un singur genom
+    genome = np.empty((ascii_height, ascii_width), dtype=tile_results[0][0].dtype)
+    for (left, top, right, bottom), (tile_genome, _) in zip(tiles, tile_results):
+        genome[top:bottom, left:right] = tile_genome
+
+    if seam_fitness is not None:
+        genome = refine_seams(genome, seam_regions((ascii_width, ascii_height), tiles, seam_width), seam_fitness,
+                              alphabet_size, population_size, seam_generation_count, tournament_size, elitism,
+                              base_mutation_rate, rng=np.random.default_rng(seeds[-1]))
+
+    tile_areas = np.array([(right - left) * (bottom - top) for left, top, right, bottom in tiles], dtype=np.float64)
+    best_fitness_history = (tile_areas @ np.array([history for _, history in tile_results])) / tile_areas.sum()
+
+    return genome, float(table_fitness(score_table, genome)), best_fitness_history.tolist()